@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     cache_ttl_lookup: int = 86400  # 24 hours
     cache_ttl_building: int = 86400  # 24 hours
     cache_ttl_neighborhood_3d: int = 86400  # 24 hours
+    cache_ttl_3dbag_bbox: int = 86400  # 24 hours
     cache_ttl_risk_cards: int = 604800  # 7 days
     cache_ttl_neighborhood: int = 2592000  # 30 days
 
@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AddressSuggestion(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     display_name: str
     type: str
@@ -9,10 +11,14 @@ class AddressSuggestion(BaseModel):
 
 
 class SuggestResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     suggestions: list[AddressSuggestion]
 
 
 class ResolvedAddress(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     nummeraanduiding_id: str | None = None
     adresseerbaar_object_id: str | None = None
@@ -1,9 +1,11 @@
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BuildingFacts(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     pand_id: str
     construction_year: int | None = None
     status: str | None = None
@@ -17,6 +19,8 @@ class BuildingFacts(BaseModel):
 
 
 class BuildingFactsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     address_id: str
     building: BuildingFacts | None = None
     message: str | None = None
@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UrbanizationLevel(str, Enum):
@@ -13,18 +13,24 @@ class UrbanizationLevel(str, Enum):
 
 
 class AgeProfile(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     age_0_24: float | None = None
     age_25_64: float | None = None
     age_65_plus: float | None = None
 
 
 class NeighborhoodIndicator(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     value: float | str | None = None
     unit: str | None = None
     available: bool = True
 
 
 class NeighborhoodStats(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     buurt_code: str
     buurt_name: str | None = None
     gemeente_name: str | None = None
@@ -40,6 +46,8 @@ class NeighborhoodStats(BaseModel):
 
 
 class NeighborhoodStatsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     address_id: str
     stats: NeighborhoodStats | None = None
     source: str = "CBS Wijken & Buurten 2024"
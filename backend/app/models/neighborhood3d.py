@@ -1,15 +1,19 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BuildingBlock(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     pand_id: str
     ground_height: float
     building_height: float
-    footprint: list[list[float]]  # [[dx, dy], ...] meter offsets from center
+    footprint: list[tuple[float, float]]  # [(dx, dy), ...] meter offsets from center
     year: int | None = None
 
 
 class Neighborhood3DCenter(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     lat: float
     lng: float
     rd_x: float
@@ -17,6 +21,8 @@ class Neighborhood3DCenter(BaseModel):
 
 
 class Neighborhood3DResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     address_id: str
     target_pand_id: str | None = None
     center: Neighborhood3DCenter
@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RiskLevel(str, Enum):
@@ -11,6 +11,8 @@ class RiskLevel(str, Enum):
 
 
 class NoiseRiskCard(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     level: RiskLevel
     lden_db: float | None = None
     source: str
@@ -21,6 +23,8 @@ class NoiseRiskCard(BaseModel):
 
 
 class AirQualityRiskCard(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     level: RiskLevel
     pm25_ug_m3: float | None = None
     no2_ug_m3: float | None = None
@@ -35,6 +39,8 @@ class AirQualityRiskCard(BaseModel):
 
 
 class ClimateStressRiskCard(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     level: RiskLevel
     heat_value: float | None = None
     heat_level: RiskLevel = RiskLevel.unavailable
@@ -51,6 +57,8 @@ class ClimateStressRiskCard(BaseModel):
 
 
 class RiskCardsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     address_id: str
     noise: NoiseRiskCard
     air_quality: AirQualityRiskCard
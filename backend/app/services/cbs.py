@@ -2,6 +2,8 @@ import logging
 from typing import Any
 
 import httpx
+import numpy as np
+import orjson
 
 from app.config import settings
 from app.models.neighborhood import (
@@ -85,6 +87,18 @@ def _parse_age_profile(props: dict[str, Any]) -> AgeProfile:
     )
 
 
+# (NeighborhoodStats field, CBS property, unit)
+_INDICATORS: tuple[tuple[str, str, str | None], ...] = (
+    ("population_density", "bevolkingsdichtheid_inwoners_per_km2", "per km\u00b2"),
+    ("avg_household_size", "gemiddelde_huishoudsgrootte", None),
+    ("single_person_pct", "percentage_eenpersoonshuishoudens", "%"),
+    ("owner_occupied_pct", "percentage_koopwoningen", "%"),
+    ("avg_property_value", "gemiddelde_woningwaarde", "\u20ac"),
+    ("distance_to_train_km", "treinstation_gemiddelde_afstand_in_km", "km"),
+    ("distance_to_supermarket_km", "grote_supermarkt_gemiddelde_afstand_in_km", "km"),
+)
+
+
 def _parse_stats(feature: dict[str, Any]) -> NeighborhoodStats | None:
     props = feature.get("properties") or {}
     buurt_code = props.get("buurtcode")
@@ -95,63 +109,112 @@ def _parse_stats(feature: dict[str, Any]) -> NeighborhoodStats | None:
         buurt_code=buurt_code,
         buurt_name=props.get("buurtnaam"),
         gemeente_name=props.get("gemeentenaam"),
-        population_density=_make_indicator(
-            props, "bevolkingsdichtheid_inwoners_per_km2", "per km\u00b2"
-        ),
-        avg_household_size=_make_indicator(
-            props, "gemiddelde_huishoudsgrootte"
-        ),
-        single_person_pct=_make_indicator(
-            props, "percentage_eenpersoonshuishoudens", "%"
-        ),
         age_profile=_parse_age_profile(props),
-        owner_occupied_pct=_make_indicator(
-            props, "percentage_koopwoningen", "%"
-        ),
-        avg_property_value=_make_indicator(
-            props, "gemiddelde_woningwaarde", "\u20ac"
-        ),
-        distance_to_train_km=_make_indicator(
-            props, "treinstation_gemiddelde_afstand_in_km", "km"
-        ),
-        distance_to_supermarket_km=_make_indicator(
-            props, "grote_supermarkt_gemiddelde_afstand_in_km", "km"
-        ),
         urbanization=_parse_urbanization(props),
+        **{field: _make_indicator(props, key, unit) for field, key, unit in _INDICATORS},
     )
 
 
-def _point_in_ring(x: float, y: float, ring: list[list[float]]) -> bool:
-    if len(ring) < 3:
-        return False
-    inside = False
-    j = len(ring) - 1
-    for i in range(len(ring)):
-        xi, yi = ring[i][0], ring[i][1]
-        xj, yj = ring[j][0], ring[j][1]
-        intersects = ((yi > y) != (yj > y)) and (
-            x < (xj - xi) * (y - yi) / (yj - yi) + xi
-        )
-        if intersects:
-            inside = not inside
-        j = i
-    return inside
-
-
-def _geometry_contains_point(
-    geom: dict[str, Any] | None, x: float, y: float
-) -> bool:
-    if not geom:
-        return False
+def _outer_rings(geom: dict[str, Any]) -> list[np.ndarray]:
+    """Outer rings as float64 arrays, converted once and cached on the geometry."""
+    rings = geom.get("_rings")
+    if rings is not None:
+        return rings
     geom_type = geom.get("type")
     coords = geom.get("coordinates")
-    if not coords:
-        return False
     if geom_type == "Polygon":
-        return _point_in_ring(x, y, coords[0])
-    if geom_type in {"MultiPolygon", "MultiSurface"}:
-        return any(_point_in_ring(x, y, polygon[0]) for polygon in coords)
-    return False
+        polygons = [coords]
+    elif geom_type in {"MultiPolygon", "MultiSurface"}:
+        polygons = coords
+    else:
+        polygons = []
+    rings = [
+        np.ascontiguousarray(polygon[0], dtype=np.float64)
+        for polygon in polygons
+        if polygon
+    ]
+    geom["_rings"] = rings
+    return rings
+
+
+def _ring_bboxes(geom: dict[str, Any]) -> np.ndarray:
+    """(minx, miny, maxx, maxy) per outer ring, cached on the geometry.
+
+    Degenerate rings get a NaN row, which fails every comparison.
+    """
+    bboxes = geom.get("_ring_bboxes")
+    if bboxes is None:
+        rings = _outer_rings(geom)
+        bboxes = np.full((len(rings), 4), np.nan)
+        for i, ring in enumerate(rings):
+            if ring.ndim == 2 and len(ring) >= 3:
+                bboxes[i, :2] = ring[:, :2].min(axis=0)
+                bboxes[i, 2:] = ring[:, :2].max(axis=0)
+        geom["_ring_bboxes"] = bboxes
+    return bboxes
+
+
+def _bbox_contains_point(geom: dict[str, Any], x: float, y: float) -> bool:
+    """Cheap envelope test, cached on the geometry, to skip ray casting."""
+    bbox = geom.get("_bbox")
+    if bbox is None:
+        bboxes = _ring_bboxes(geom)
+        bboxes = bboxes[~np.isnan(bboxes[:, 0])]
+        if not len(bboxes):
+            return False
+        bbox = (*bboxes[:, :2].min(axis=0).tolist(), *bboxes[:, 2:].max(axis=0).tolist())
+        geom["_bbox"] = bbox
+    minx, miny, maxx, maxy = bbox
+    return minx <= x <= maxx and miny <= y <= maxy
+
+
+def _pip_bulk(points: np.ndarray, starts: np.ndarray, x: float, y: float) -> np.ndarray:
+    """Odd-crossings test for many rings stacked in one (N, 2) array.
+
+    ``starts`` holds the first row of each ring followed by ``len(points)``.
+    Returns one bool per ring.
+    """
+    xs, ys = points[:, 0], points[:, 1]
+    # Each vertex pairs with its predecessor; ring starts wrap to their ring's end.
+    prev = np.arange(-1, len(points) - 1)
+    prev[starts[:-1]] = starts[1:] - 1
+    xj, yj = xs[prev], ys[prev]
+    straddles = (ys > y) != (yj > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = (xj - xs) * (y - ys) / (yj - ys) + xs
+    crossings = (straddles & (x < x_cross)).astype(np.intp)
+    return (np.add.reduceat(crossings, starts[:-1]) & 1).astype(bool)
+
+
+def _first_containing(
+    features: list[dict[str, Any]], x: float, y: float
+) -> dict[str, Any] | None:
+    """First feature whose geometry contains the point, tested in one NumPy pass."""
+    rings: list[np.ndarray] = []
+    owners: list[int] = []
+    for idx, feat in enumerate(features):
+        geom = feat.get("geometry")
+        if not geom or not geom.get("coordinates"):
+            continue
+        if not _bbox_contains_point(geom, x, y):
+            continue
+        # Only rings whose own envelope holds the point go to ray casting.
+        bboxes = _ring_bboxes(geom)
+        near = (
+            (bboxes[:, 0] <= x) & (x <= bboxes[:, 2])
+            & (bboxes[:, 1] <= y) & (y <= bboxes[:, 3])
+        )
+        outer = _outer_rings(geom)
+        for i in np.flatnonzero(near):
+            rings.append(outer[i][:, :2])
+            owners.append(idx)
+    if not rings:
+        return None
+
+    starts = np.zeros(len(rings) + 1, dtype=np.intp)
+    np.cumsum([len(ring) for ring in rings], out=starts[1:])
+    hits = np.flatnonzero(_pip_bulk(np.concatenate(rings), starts, x, y))
+    return features[owners[hits[0]]] if len(hits) else None
 
 
 async def _fetch_by_buurt_code(buurt_code: str) -> dict[str, Any] | None:
@@ -165,7 +228,7 @@ async def _fetch_by_buurt_code(buurt_code: str) -> dict[str, Any] | None:
         },
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     features = data.get("features") or []
     return features[0] if features else None
 
@@ -183,16 +246,15 @@ async def _fetch_by_bbox(lat: float, lng: float) -> dict[str, Any] | None:
         },
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     features = data.get("features") or []
     if not features:
         return None
 
     # Point-in-polygon to find the buurt that actually contains the point
-    for feat in features:
-        geom = feat.get("geometry")
-        if _geometry_contains_point(geom, lng, lat):
-            return feat
+    match = _first_containing(features, lng, lat)
+    if match is not None:
+        return match
 
     # Fallback: return first feature
     return features[0]
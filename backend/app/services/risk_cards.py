@@ -25,8 +25,11 @@ _client_loop_id: int | None = None
 _alo_layers_cache: tuple[float, list[str]] | None = None
 _gcn_layers_cache: tuple[float, list[str]] | None = None
 _climate_layers_cache: tuple[float, set[str]] | None = None
+_utc_date_cache: tuple[int, str] | None = None
 
 _LAYER_CACHE_TTL_SECONDS = 24 * 60 * 60
+# WFS features are queried in a 10 m square around the address (RD metres).
+_WFS_BBOX_HALF = 5.0
 
 # Klimaateffectatlas is highly regional; keep this to 10 curated layers only (PRD guidance).
 _CLIMATE_HEAT_LAYERS: list[tuple[str, str]] = [
@@ -61,7 +64,15 @@ def _get_client() -> httpx.AsyncClient:
 
 
 def _utc_now_iso_date() -> str:
-    return datetime.now(UTC).date().isoformat()
+    global _utc_date_cache
+    # Memoized per wall-clock minute; UTC midnight is always a minute boundary.
+    now = time.time()
+    minute = int(now // 60)
+    if _utc_date_cache and _utc_date_cache[0] == minute:
+        return _utc_date_cache[1]
+    today = datetime.fromtimestamp(now, UTC).date().isoformat()
+    _utc_date_cache = (minute, today)
+    return today
 
 
 def _extract_layer_date(layer_name: str | None) -> str | None:
@@ -206,7 +217,10 @@ async def _sample_wfs_properties(layer: str, rd_x: float, rd_y: float) -> dict[s
         "version": "2.0.0",
         "request": "GetFeature",
         "typeNames": layer,
-        "bbox": f"{rd_x - 5},{rd_y - 5},{rd_x + 5},{rd_y + 5},EPSG:28992",
+        "bbox": (
+            f"{rd_x - _WFS_BBOX_HALF},{rd_y - _WFS_BBOX_HALF},"
+            f"{rd_x + _WFS_BBOX_HALF},{rd_y + _WFS_BBOX_HALF},EPSG:28992"
+        ),
         "srsName": "EPSG:28992",
         "count": "5",
         "outputFormat": "application/json",
@@ -1,33 +1,91 @@
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 
 import httpx
+import numpy as np
+import orjson
 
+from app.cache.redis import cache_get, cache_set
 from app.config import settings
 from app.models.neighborhood3d import BuildingBlock, Neighborhood3DCenter, Neighborhood3DResponse
 
+try:
+    from numba import njit
+except ImportError:  # optional dependency, see the "jit" extra
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 _client: httpx.AsyncClient | None = None
 
 MAX_PAGES = 3
+PAGE_SIZE = 20  # items per regular page; later pages are batched in one request
+
+_PAND_PREFIX = "NL.IMBAG.Pand."
+
+# CityJSON transform used when a response omits metadata.transform
+_DEFAULT_SCALE = (0.001, 0.001, 0.001)
+_DEFAULT_TRANSLATE = (0.0, 0.0, 0.0)
 BBOX_TIMEOUT = 20.0  # total time budget for bbox fetch (seconds)
 PER_PAGE_TIMEOUT = 20.0  # per-page HTTP timeout (seconds)
 
+# Parsed bbox results keyed by (rd_x, rd_y) rounded to 10 m plus radius.
+# Entries hold (expires_at, center_x, center_y, buildings) with expires_at on
+# the time.monotonic() clock; footprints are
+# relative to that stored center and get shifted on hits from nearby points.
+_BboxCacheKey = tuple[int, int, int]
+_BboxCacheEntry = tuple[float, float, float, list[BuildingBlock]]
+_bbox_cache: OrderedDict[_BboxCacheKey, _BboxCacheEntry] = OrderedDict()
+_BBOX_CACHE_TTL_SECONDS = 60 * 60
+_BBOX_CACHE_MAX_ENTRIES = 256
+# Entries are fetched this much wider than requested, so any point in the same
+# 10 m cell (at most ~7.1 m from the stored center) still gets a full disc.
+_BBOX_CACHE_PAD = 10.0
+# One in-flight load per key, so concurrent misses share a single 3DBAG fetch
+_bbox_inflight: dict[_BboxCacheKey, asyncio.Task[_BboxCacheEntry | None]] = {}
+
 
 def _get_client() -> httpx.AsyncClient:
     global _client
     if _client is None or _client.is_closed:
-        _client = httpx.AsyncClient(timeout=httpx.Timeout(10.0, connect=3.0))
+        # HTTP/2 lets the parallel single-item and bbox requests multiplex over
+        # one warm TLS connection to api.3dbag.nl.
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
     return _client
 
 
+def _footprint_offsets(
+    vertices: np.ndarray, idx: np.ndarray, sx: float, sy: float, ox: float, oy: float
+) -> np.ndarray:
+    """Scalar gather-and-transform loop; only used when compiled with numba."""
+    out = np.empty((len(idx), 2))
+    for k in range(len(idx)):
+        out[k, 0] = vertices[idx[k], 0] * sx + ox
+        out[k, 1] = vertices[idx[k], 1] * sy + oy
+    return out
+
+
+_footprint_offsets_jit = None
+if njit is not None:
+    _footprint_offsets_jit = njit(cache=True)(_footprint_offsets)
+    # Compile at import for the int64 vertex arrays np.asarray yields for
+    # CityJSON, so the first neighborhood request does not pay the JIT latency.
+    _footprint_offsets_jit(
+        np.zeros((3, 3), dtype=np.int64), np.arange(3, dtype=np.intp), 1.0, 1.0, 0.0, 0.0
+    )
+
+
 def _parse_building(
     city_object: dict,
-    vertices: list[list[int]],
-    scale: list[float],
-    translate: list[float],
+    vertices: np.ndarray | list[list[int]],
+    scale: list[float] | tuple[float, ...],
+    translate: list[float] | tuple[float, ...],
     center_x: float,
     center_y: float,
 ) -> BuildingBlock | None:
@@ -61,36 +119,42 @@ def _parse_building(
     # MultiSurface boundaries: [[[idx, idx, ...], [hole_ring]], ...]
     # First surface, first ring (outer boundary)
     outer_ring = boundaries[0][0] if isinstance(boundaries[0][0], list) else boundaries[0]
+    if len(outer_ring) < 3:
+        return None
 
     # Decode vertex indices to real coordinates, compute offsets from center
-    footprint: list[list[float]] = []
-    for idx in outer_ring:
-        if idx >= len(vertices):
-            continue
-        v = vertices[idx]
-        real_x = v[0] * scale[0] + translate[0]
-        real_y = v[1] * scale[1] + translate[1]
-        dx = real_x - center_x
-        dy = real_y - center_y
-        footprint.append([round(dx, 2), round(dy, 2)])
-
-    if len(footprint) < 3:
+    vertices = np.asarray(vertices)
+    idx = np.asarray(outer_ring, dtype=np.intp)
+    idx = idx[idx < len(vertices)]
+    if len(idx) < 3:
         return None
+    sx, sy = float(scale[0]), float(scale[1])
+    ox, oy = float(translate[0]) - center_x, float(translate[1]) - center_y
+    if _footprint_offsets_jit is not None and np.issubdtype(vertices.dtype, np.integer):
+        # Normalise to int64 (np.asarray yields int32 on Windows with numpy<2)
+        # so the kernel keeps a single compiled signature.
+        points = _footprint_offsets_jit(
+            vertices.astype(np.int64, copy=False), idx, sx, sy, ox, oy
+        )
+    else:
+        points = vertices[idx, :2] * (sx, sy) + (ox, oy)
+    footprint: list[tuple[float, float]] = list(map(tuple, points.round(2).tolist()))
 
     year = attrs.get("oorspronkelijkbouwjaar")
 
     raw_id = attrs.get("identificatie", "unknown")
     # 3DBAG returns prefixed IDs like "NL.IMBAG.Pand.0363100012253924"
     # Strip prefix to match BAG's raw 16-digit format
-    if raw_id.startswith("NL.IMBAG.Pand."):
-        raw_id = raw_id[len("NL.IMBAG.Pand."):]
-
-    return BuildingBlock(
-        pand_id=raw_id,
-        ground_height=round(h_maaiveld, 2),
-        building_height=round(building_height, 2),
+    if raw_id.startswith(_PAND_PREFIX):
+        raw_id = raw_id[len(_PAND_PREFIX):]
+
+    # Every field is coerced above, so skip Pydantic validation on this hot path
+    return BuildingBlock.model_construct(
+        pand_id=str(raw_id),
+        ground_height=round(float(h_maaiveld), 2),
+        building_height=round(float(building_height), 2),
         footprint=footprint,
-        year=year,
+        year=int(year) if year is not None else None,
     )
 
 
@@ -99,13 +163,13 @@ async def _fetch_target_building(
 ) -> BuildingBlock | None:
     """Fetch a single building directly by pand_id from the 3DBAG single-item endpoint."""
     client = _get_client()
-    prefixed_id = f"NL.IMBAG.Pand.{pand_id}"
+    prefixed_id = _PAND_PREFIX + pand_id
     url = f"{settings.three_d_bag_base}/collections/pand/items/{prefixed_id}"
 
     try:
         resp = await client.get(url)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
     except (httpx.HTTPError, httpx.TimeoutException):
         return None
 
@@ -120,9 +184,9 @@ async def _fetch_target_building(
     # Fall back to inner metadata for compatibility
     if not transform:
         transform = inner.get("metadata", {}).get("transform", {})
-    scale = transform.get("scale", [0.001, 0.001, 0.001])
-    translate = transform.get("translate", [0.0, 0.0, 0.0])
-    vertices = inner.get("vertices", [])
+    scale = transform.get("scale", _DEFAULT_SCALE)
+    translate = transform.get("translate", _DEFAULT_TRANSLATE)
+    vertices = np.asarray(inner.get("vertices", []))
     city_objects = inner.get("CityObjects", {})
 
     for co_data in city_objects.values():
@@ -135,6 +199,43 @@ async def _fetch_target_building(
     return None
 
 
+def _within_radius(blocks: list[BuildingBlock], radius: float) -> list[BuildingBlock]:
+    """Keep buildings whose footprint centroid lies within ``radius`` of the center."""
+    if not blocks:
+        return blocks
+    counts = np.fromiter((len(b.footprint) for b in blocks), dtype=np.intp, count=len(blocks))
+    points = np.array([p for b in blocks for p in b.footprint], dtype=np.float64)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    # Footprints always have >= 3 vertices, so no reduceat segment is empty.
+    centroids = np.add.reduceat(points, starts, axis=0) / counts[:, None]
+    keep = np.einsum("ij,ij->i", centroids, centroids) <= radius * radius
+    return [b for b, k in zip(blocks, keep) if k]
+
+
+def _parse_bbox_page(
+    data: dict, center_x: float, center_y: float, radius: float
+) -> list[BuildingBlock]:
+    """Parse the Buildings in one FeatureCollection page that lie within ``radius``."""
+    transform = data.get("metadata", {}).get("transform", {})
+    scale = transform.get("scale", _DEFAULT_SCALE)
+    translate = transform.get("translate", _DEFAULT_TRANSLATE)
+
+    blocks: list[BuildingBlock] = []
+    for feature in data.get("features", []):
+        vertices = np.asarray(feature.get("vertices", []))
+        city_objects = feature.get("CityObjects", {})
+
+        for co_data in city_objects.values():
+            if co_data.get("type") != "Building":
+                continue
+
+            block = _parse_building(co_data, vertices, scale, translate, center_x, center_y)
+            if block is not None:
+                blocks.append(block)
+    # The bbox is a square; drop its corners so the scene is a disc around the address.
+    return _within_radius(blocks, radius)
+
+
 async def _fetch_bbox_buildings(
     center_x: float, center_y: float, radius: float
 ) -> list[BuildingBlock]:
@@ -148,7 +249,11 @@ async def _fetch_bbox_buildings(
 
     buildings: list[BuildingBlock] = []
     page = 0
-    next_url: str | None = f"{url}?bbox={bbox}&limit=20"
+    # The first page is always a regular PAGE_SIZE request, so a slow server
+    # still yields what the old pagination did. Everything after it is then
+    # requested at once: each 3DBAG page costs a full server-side query.
+    next_url: str | None = f"{url}?bbox={bbox}&limit={PAGE_SIZE}"
+    paged_url: str | None = None  # plain next link, kept in case the batch is rejected
     start = time.monotonic()
 
     while next_url and page < MAX_PAGES:
@@ -164,8 +269,16 @@ async def _fetch_bbox_buildings(
                 timeout=httpx.Timeout(min(PER_PAGE_TIMEOUT, remaining), connect=3.0),
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except (httpx.HTTPError, httpx.TimeoutException) as exc:
+            if (
+                paged_url
+                and isinstance(exc, httpx.HTTPStatusError)
+                and exc.response.is_client_error
+            ):
+                logger.info("Bbox limit rejected (%s); falling back to pagination", exc)
+                next_url, paged_url = paged_url, None
+                continue
             page_duration = time.monotonic() - page_start
             logger.warning(
                 "Bbox page %d failed after %.1fs: %s", page + 1, page_duration, exc
@@ -174,35 +287,33 @@ async def _fetch_bbox_buildings(
 
         page_duration = time.monotonic() - page_start
 
-        transform = data.get("metadata", {}).get("transform", {})
-        scale = transform.get("scale", [0.001, 0.001, 0.001])
-        translate = transform.get("translate", [0.0, 0.0, 0.0])
-
-        page_buildings = 0
-        for feature in data.get("features", []):
-            vertices = feature.get("vertices", [])
-            city_objects = feature.get("CityObjects", {})
-
-            for co_data in city_objects.values():
-                if co_data.get("type") != "Building":
-                    continue
-
-                block = _parse_building(co_data, vertices, scale, translate, center_x, center_y)
-                if block is not None:
-                    buildings.append(block)
-                    page_buildings += 1
+        # Parse off the event loop so other requests aren't stalled by a large page
+        page_blocks = await asyncio.to_thread(
+            _parse_bbox_page, data, center_x, center_y, radius
+        )
+        buildings.extend(page_blocks)
 
         logger.info(
-            "Bbox page %d: %d buildings in %.1fs", page + 1, page_buildings, page_duration
+            "Bbox page %d: %d buildings in %.1fs", page + 1, len(page_blocks), page_duration
         )
 
+        page += 1
+        if paged_url:
+            # The batched request covered every remaining page
+            break
+
         # Follow pagination
         next_url = None
         for link in data.get("links", []):
             if link.get("rel") == "next":
                 next_url = link.get("href")
                 break
-        page += 1
+
+        if page == 1 and next_url:
+            paged_url = next_url
+            next_url = str(
+                httpx.URL(next_url).copy_set_param("limit", (MAX_PAGES - 1) * PAGE_SIZE)
+            )
 
     total_duration = time.monotonic() - start
     logger.info(
@@ -213,6 +324,88 @@ async def _fetch_bbox_buildings(
     return buildings
 
 
+def _shift_buildings(
+    buildings: list[BuildingBlock], dx: float, dy: float
+) -> list[BuildingBlock]:
+    """Re-express footprint offsets relative to a center moved by (-dx, -dy)."""
+    return [
+        b.model_copy(
+            update={"footprint": [(round(x + dx, 2), round(y + dy, 2)) for x, y in b.footprint]}
+        )
+        for b in buildings
+    ]
+
+
+async def _load_bbox_entry(
+    key: _BboxCacheKey, center_x: float, center_y: float, radius: float
+) -> _BboxCacheEntry | None:
+    """Fill one LRU slot from Redis, else from 3DBAG; None when nothing was found."""
+    now = time.monotonic()
+    # Redis keeps parsed tiles across restarts and worker processes
+    redis_key = "3dbag_bbox:{}:{}:{}".format(*key)
+    cached = await cache_get(redis_key)
+    if cached:
+        buildings = [BuildingBlock.model_validate(b) for b in cached["buildings"]]
+        # Never keep a tile in memory past its Redis expiry; payloads without a
+        # fetch time are served from Redis only.
+        fetched_at = cached.get("fetched_at")
+        redis_left = (
+            settings.cache_ttl_3dbag_bbox - (time.time() - fetched_at)
+            if fetched_at is not None
+            else 0.0
+        )
+        expires_at = now + min(_BBOX_CACHE_TTL_SECONDS, redis_left)
+        entry = (expires_at, cached["center_x"], cached["center_y"], buildings)
+    else:
+        buildings = await _fetch_bbox_buildings(center_x, center_y, radius + _BBOX_CACHE_PAD)
+        # Don't cache empty results (may be a transient upstream failure)
+        if not buildings:
+            return None
+        entry = (now + _BBOX_CACHE_TTL_SECONDS, center_x, center_y, buildings)
+        await cache_set(
+            redis_key,
+            {
+                "fetched_at": time.time(),
+                "center_x": center_x,
+                "center_y": center_y,
+                "buildings": [b.model_dump() for b in buildings],
+            },
+            ttl=settings.cache_ttl_3dbag_bbox,
+        )
+    _bbox_cache[key] = entry
+    # Reassigning an existing (expired) key keeps its old slot; refresh it
+    _bbox_cache.move_to_end(key)
+    while len(_bbox_cache) > _BBOX_CACHE_MAX_ENTRIES:
+        _bbox_cache.popitem(last=False)
+    return entry
+
+
+async def _cached_bbox_buildings(
+    center_x: float, center_y: float, radius: float
+) -> list[BuildingBlock]:
+    """Return bbox buildings from the in-process LRU, then Redis, fetching on miss."""
+    key = (int(round(center_x, -1)), int(round(center_y, -1)), int(radius))
+    entry = _bbox_cache.get(key)
+    if entry and time.monotonic() < entry[0]:
+        _bbox_cache.move_to_end(key)
+    else:
+        task = _bbox_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(_load_bbox_entry(key, center_x, center_y, radius))
+            _bbox_inflight[key] = task
+            task.add_done_callback(lambda _: _bbox_inflight.pop(key, None))
+        # Shielded so one cancelled caller doesn't abort the load for the others
+        entry = await asyncio.shield(task)
+        if entry is None:
+            return []
+
+    _, cached_x, cached_y, buildings = entry
+    if cached_x != center_x or cached_y != center_y:
+        buildings = _shift_buildings(buildings, cached_x - center_x, cached_y - center_y)
+    # Entries hold a padded disc around their own center; trim it to this one
+    return _within_radius(buildings, radius)
+
+
 async def get_neighborhood_3d(
     pand_id: str,
     rd_x: float,
@@ -226,7 +419,7 @@ async def get_neighborhood_3d(
     # Parallel fetch: direct target + bbox neighborhood
     target_building, bbox_buildings = await asyncio.gather(
         _fetch_target_building(pand_id, rd_x, rd_y),
-        _fetch_bbox_buildings(rd_x, rd_y, radius),
+        _cached_bbox_buildings(rd_x, rd_y, radius),
     )
 
     # Merge: target first, then bbox (deduplicate by pand_id)
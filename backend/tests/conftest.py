@@ -1,7 +1,168 @@
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import orjson
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+import app.cache.redis as cache_module
+import app.services.risk_cards as risk_cards_module
 from app.main import app
+from app.models.risk import (
+    AirQualityRiskCard,
+    ClimateStressRiskCard,
+    NoiseRiskCard,
+    RiskLevel,
+)
+
+_FULL_FEATURE_PROPS = MappingProxyType({
+    "buurtcode": "BU0363AD07",
+    "buurtnaam": "Centrum-Oost",
+    "gemeentenaam": "Amsterdam",
+    "bevolkingsdichtheid_inwoners_per_km2": 15000,
+    "gemiddelde_huishoudsgrootte": 1.8,
+    "percentage_eenpersoonshuishoudens": 55.0,
+    "percentage_personen_0_tot_15_jaar": 8.0,
+    "percentage_personen_15_tot_25_jaar": 10.0,
+    "percentage_personen_25_tot_45_jaar": 40.0,
+    "percentage_personen_45_tot_65_jaar": 25.0,
+    "percentage_personen_65_jaar_en_ouder": 17.0,
+    "percentage_koopwoningen": 35.0,
+    "gemiddelde_woningwaarde": 520000,
+    "treinstation_gemiddelde_afstand_in_km": 0.8,
+    "grote_supermarkt_gemiddelde_afstand_in_km": 0.3,
+    "stedelijkheid_adressen_per_km2": 1,
+})
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker():
+    """Reset Redis circuit breaker state so no test inherits another's pool."""
+    cache_module._circuit_open_until = 0.0
+    cache_module._pool = None
+    yield
+    cache_module._circuit_open_until = 0.0
+    cache_module._pool = None
+
+
+def _make_model(cls, **kwargs):
+    return cls.model_construct(**kwargs)
+
+
+@pytest.fixture(scope="session")
+def make():
+    """Build a Pydantic model from trusted literals without running validation."""
+    return _make_model
+
+
+@pytest.fixture
+def cbs_client(monkeypatch):
+    """AsyncMock HTTP client installed as the CBS service client."""
+    client = AsyncMock()
+    monkeypatch.setattr("app.services.cbs._get_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def mock_cbs_response(cbs_client):
+    """Make cbs_client.get return a response whose body is the serialized payload."""
+    def _make(payload: dict):
+        resp = MagicMock(content=orjson.dumps(payload))
+        cbs_client.get.return_value = resp
+        return cbs_client, resp
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def full_feature():
+    """Shared CBS buurt feature with every indicator populated. Do not mutate."""
+    return {"properties": dict(_FULL_FEATURE_PROPS)}
+
+
+@pytest.fixture
+def full_feature_factory():
+    """Build a fresh full CBS feature for tests that modify it."""
+    def _make() -> dict:
+        return {"properties": dict(_FULL_FEATURE_PROPS)}
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def wfs_response_factory():
+    """Build a MagicMock GeoJSON WFS response for a feature-collection payload."""
+    def _make(payload: dict):
+        resp = MagicMock(spec=httpx.Response)
+        resp.raise_for_status = MagicMock()
+        resp.headers = {"content-type": "application/json"}
+        resp.json = MagicMock(return_value=payload)
+        return resp
+
+    return _make
+
+
+@pytest.fixture
+def risk_mocks(monkeypatch):
+    """Replace the risk-card builders and their layer/sample helpers with AsyncMocks."""
+    mocks = SimpleNamespace(
+        noise_card=AsyncMock(),
+        air_card=AsyncMock(),
+        climate_card=AsyncMock(),
+        alo_layers=AsyncMock(),
+        gcn_layers=AsyncMock(),
+        wms_sample=AsyncMock(),
+        climate_layers=AsyncMock(),
+        climate_sample=AsyncMock(),
+    )
+    targets = {
+        "_build_noise_card": mocks.noise_card,
+        "_build_air_card": mocks.air_card,
+        "_build_climate_card": mocks.climate_card,
+        "_get_alo_layers": mocks.alo_layers,
+        "_get_gcn_layers": mocks.gcn_layers,
+        "_sample_wms_properties": mocks.wms_sample,
+        "_get_climate_layer_names": mocks.climate_layers,
+        "_sample_climate_layer": mocks.climate_sample,
+    }
+    for name, mock in targets.items():
+        monkeypatch.setattr(risk_cards_module, name, mock)
+    return mocks
+
+
+@pytest.fixture(scope="module")
+def sample_noise_card():
+    return NoiseRiskCard.model_construct(
+        level=RiskLevel.low,
+        lden_db=50.0,
+        source="RIVM / Atlas Leefomgeving WMS",
+        sampled_at="2026-02-05",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_air_card():
+    return AirQualityRiskCard.model_construct(
+        level=RiskLevel.medium,
+        pm25_ug_m3=8.0,
+        no2_ug_m3=17.0,
+        pm25_level=RiskLevel.medium,
+        no2_level=RiskLevel.medium,
+        source="RIVM GCN WMS",
+        sampled_at="2026-02-05",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_climate_card():
+    return ClimateStressRiskCard.model_construct(
+        level=RiskLevel.high,
+        heat_level=RiskLevel.high,
+        water_level=RiskLevel.medium,
+        source="Klimaateffectatlas WMS/WFS",
+        sampled_at="2026-02-05",
+    )
 
 
 @pytest.fixture
@@ -1,9 +1,6 @@
 import time
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
-import app.cache.redis as cache_module
 from app.models.address import AddressSuggestion, ResolvedAddress
 from app.models.building import BuildingFacts
 from app.models.neighborhood import (
@@ -23,20 +20,26 @@ from app.models.risk import (
 )
 
 
-@pytest.mark.asyncio
+def async_return(value):
+    """Coroutine function stub for service calls whose mock is never inspected."""
+    async def _stub(*args, **kwargs):
+        return value
+
+    return _stub
+
+
 async def test_health(client):
     resp = await client.get("/health")
     assert resp.status_code == 200
     assert resp.json() == {"status": "ok"}
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.locatieserver")
 async def test_suggest_endpoint(mock_ls, mock_cache_set, mock_cache_get, client):
-    mock_ls.suggest = AsyncMock(
-        return_value=[
+    mock_ls.suggest = async_return(
+        [
             AddressSuggestion(
                 id="adr-123",
                 display_name="Kalverstraat 1, Amsterdam",
@@ -54,19 +57,17 @@ async def test_suggest_endpoint(mock_ls, mock_cache_set, mock_cache_get, client)
     assert data["suggestions"][0]["display_name"] == "Kalverstraat 1, Amsterdam"
 
 
-@pytest.mark.asyncio
 async def test_suggest_too_short(client):
     resp = await client.get("/api/address/suggest", params={"q": "k"})
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.locatieserver")
 async def test_lookup_endpoint(mock_ls, mock_cache_set, mock_cache_get, client):
-    mock_ls.lookup = AsyncMock(
-        return_value=ResolvedAddress(
+    mock_ls.lookup = async_return(
+        ResolvedAddress(
             id="adr-123",
             display_name="Kalverstraat 1, 1012NX Amsterdam",
             street="Kalverstraat",
@@ -88,24 +89,22 @@ async def test_lookup_endpoint(mock_ls, mock_cache_set, mock_cache_get, client):
     assert data["latitude"] == 52.372
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.locatieserver")
 async def test_lookup_not_found(mock_ls, mock_cache_set, mock_cache_get, client):
-    mock_ls.lookup = AsyncMock(return_value=None)
+    mock_ls.lookup = async_return(None)
 
     resp = await client.get("/api/address/lookup", params={"id": "adr-nonexistent"})
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.bag")
 async def test_building_facts_endpoint(mock_bag, mock_cache_set, mock_cache_get, client):
-    mock_bag.get_building_facts = AsyncMock(
-        return_value=BuildingFacts(
+    mock_bag.get_building_facts = async_return(
+        BuildingFacts(
             pand_id="0363100012253924",
             construction_year=1917,
             status="Pand in gebruik",
@@ -126,12 +125,11 @@ async def test_building_facts_endpoint(mock_bag, mock_cache_set, mock_cache_get,
     assert data["building"]["status_en"] == "In use"
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.bag")
 async def test_building_facts_no_building(mock_bag, mock_cache_set, mock_cache_get, client):
-    mock_bag.get_building_facts = AsyncMock(return_value=None)
+    mock_bag.get_building_facts = async_return(None)
 
     resp = await client.get("/api/address/0000000000000000/building")
     assert resp.status_code == 200
@@ -140,22 +138,16 @@ async def test_building_facts_no_building(mock_bag, mock_cache_set, mock_cache_g
     assert data["message"] is not None
 
 
-@pytest.mark.asyncio
 async def test_building_facts_invalid_vbo_id(client):
     resp = await client.get("/api/address/not-valid/building")
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.locatieserver")
 async def test_suggest_works_without_redis(mock_ls, client):
     """Suggest endpoint returns 200 without Redis running (no cache mocks)."""
-    # Reset circuit breaker and pool so real Redis connection is attempted
-    cache_module._circuit_open_until = 0.0
-    cache_module._pool = None
-
-    mock_ls.suggest = AsyncMock(
-        return_value=[
+    mock_ls.suggest = async_return(
+        [
             AddressSuggestion(
                 id="adr-123",
                 display_name="Kalverstraat 1, Amsterdam",
@@ -175,17 +167,13 @@ async def test_suggest_works_without_redis(mock_ls, client):
     assert len(data["suggestions"]) == 1
     assert elapsed < 3.0  # Must complete in under 3 seconds
 
-    cache_module._circuit_open_until = 0.0
-    cache_module._pool = None
-
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.three_d_bag")
 async def test_neighborhood_3d_endpoint(mock_3d, mock_cache_set, mock_cache_get, client):
-    mock_3d.get_neighborhood_3d = AsyncMock(
-        return_value=Neighborhood3DResponse(
+    mock_3d.get_neighborhood_3d = async_return(
+        Neighborhood3DResponse(
             address_id="0363100012253924",
             target_pand_id="0363100012253924",
             center=Neighborhood3DCenter(lat=52.372, lng=4.892, rd_x=121286.0, rd_y=487296.0),
@@ -194,7 +182,7 @@ async def test_neighborhood_3d_endpoint(mock_3d, mock_cache_set, mock_cache_get,
                     pand_id="0363100012253924",
                     ground_height=1.75,
                     building_height=16.43,
-                    footprint=[[0.0, 0.0], [5.0, 0.0], [5.0, 5.0], [0.0, 5.0]],
+                    footprint=[(0.0, 0.0), (5.0, 0.0), (5.0, 5.0), (0.0, 5.0)],
                     year=1917,
                 )
             ],
@@ -218,7 +206,6 @@ async def test_neighborhood_3d_endpoint(mock_3d, mock_cache_set, mock_cache_get,
     assert data["buildings"][0]["building_height"] == 16.43
 
 
-@pytest.mark.asyncio
 async def test_neighborhood_3d_invalid_vbo_id(client):
     resp = await client.get(
         "/api/address/not-valid/neighborhood3d",
@@ -233,13 +220,11 @@ async def test_neighborhood_3d_invalid_vbo_id(client):
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
 async def test_neighborhood_3d_missing_params(client):
     resp = await client.get("/api/address/0363010000696734/neighborhood3d")
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.three_d_bag")
@@ -247,8 +232,8 @@ async def test_neighborhood_3d_caches_successful_response(
     mock_3d, mock_cache_set, mock_cache_get, client,
 ):
     """cache_set is called when the response contains buildings."""
-    mock_3d.get_neighborhood_3d = AsyncMock(
-        return_value=Neighborhood3DResponse(
+    mock_3d.get_neighborhood_3d = async_return(
+        Neighborhood3DResponse(
             address_id="0363100012253924",
             target_pand_id="0363100012253924",
             center=Neighborhood3DCenter(lat=52.372, lng=4.892, rd_x=121286.0, rd_y=487296.0),
@@ -257,7 +242,7 @@ async def test_neighborhood_3d_caches_successful_response(
                     pand_id="0363100012253924",
                     ground_height=1.75,
                     building_height=16.43,
-                    footprint=[[0.0, 0.0], [5.0, 0.0], [5.0, 5.0], [0.0, 5.0]],
+                    footprint=[(0.0, 0.0), (5.0, 0.0), (5.0, 5.0), (0.0, 5.0)],
                     year=1917,
                 )
             ],
@@ -278,7 +263,6 @@ async def test_neighborhood_3d_caches_successful_response(
     mock_cache_set.assert_called_once()
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.three_d_bag")
@@ -286,8 +270,8 @@ async def test_neighborhood_3d_does_not_cache_empty_response(
     mock_3d, mock_cache_set, mock_cache_get, client,
 ):
     """cache_set is NOT called when the response has no buildings."""
-    mock_3d.get_neighborhood_3d = AsyncMock(
-        return_value=Neighborhood3DResponse(
+    mock_3d.get_neighborhood_3d = async_return(
+        Neighborhood3DResponse(
             address_id="0363100012253924",
             target_pand_id=None,
             center=Neighborhood3DCenter(lat=52.372, lng=4.892, rd_x=121286.0, rd_y=487296.0),
@@ -310,13 +294,12 @@ async def test_neighborhood_3d_does_not_cache_empty_response(
     mock_cache_set.assert_not_called()
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.risk_cards")
 async def test_risk_cards_endpoint(mock_risk_cards, mock_cache_set, mock_cache_get, client):
-    mock_risk_cards.get_risk_cards = AsyncMock(
-        return_value=RiskCardsResponse(
+    mock_risk_cards.get_risk_cards = async_return(
+        RiskCardsResponse(
             address_id="0363010000696734",
             noise=NoiseRiskCard(
                 level=RiskLevel.medium,
@@ -360,7 +343,6 @@ async def test_risk_cards_endpoint(mock_risk_cards, mock_cache_set, mock_cache_g
     mock_cache_set.assert_called_once()
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.risk_cards")
@@ -368,8 +350,8 @@ async def test_risk_cards_does_not_cache_on_failure_message(
     mock_risk_cards, mock_cache_set, mock_cache_get, client,
 ):
     """If any card indicates a lookup failure, do not cache."""
-    mock_risk_cards.get_risk_cards = AsyncMock(
-        return_value=RiskCardsResponse(
+    mock_risk_cards.get_risk_cards = async_return(
+        RiskCardsResponse(
             address_id="0363010000696734",
             noise=NoiseRiskCard(
                 level=RiskLevel.unavailable,
@@ -409,7 +391,6 @@ async def test_risk_cards_does_not_cache_on_failure_message(
     mock_cache_set.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_risk_cards_invalid_vbo_id(client):
     resp = await client.get(
         "/api/address/not-valid/risks",
@@ -423,7 +404,6 @@ async def test_risk_cards_invalid_vbo_id(client):
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 async def test_risk_cards_returns_502_on_unhandled_exception(
@@ -442,7 +422,6 @@ async def test_risk_cards_returns_502_on_unhandled_exception(
     assert resp.status_code == 502
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 async def test_risk_cards_does_not_cache_all_unavailable(
@@ -472,8 +451,7 @@ async def test_risk_cards_does_not_cache_all_unavailable(
     )
     with patch(
         "app.api.address.risk_cards.get_risk_cards",
-        new_callable=AsyncMock,
-        return_value=all_unavailable,
+        new=async_return(all_unavailable),
     ):
         resp = await client.get(
             "/api/address/0363010000696734/risks",
@@ -483,7 +461,6 @@ async def test_risk_cards_does_not_cache_all_unavailable(
     mock_cache_set.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_risk_cards_missing_params(client):
     """Missing rd_x/rd_y/lat/lng returns 422."""
     resp = await client.get("/api/address/0363010000696734/risks")
@@ -515,13 +492,12 @@ def _make_neighborhood_stats_response() -> NeighborhoodStatsResponse:
     )
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.cbs")
 async def test_neighborhood_endpoint(mock_cbs, mock_cache_set, mock_cache_get, client):
-    mock_cbs.get_neighborhood_stats = AsyncMock(
-        return_value=_make_neighborhood_stats_response()
+    mock_cbs.get_neighborhood_stats = async_return(
+        _make_neighborhood_stats_response()
     )
 
     resp = await client.get(
@@ -536,13 +512,12 @@ async def test_neighborhood_endpoint(mock_cbs, mock_cache_set, mock_cache_get, c
     mock_cache_set.assert_called_once()
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.cbs")
 async def test_neighborhood_caches_by_buurt_code(mock_cbs, mock_cache_set, mock_cache_get, client):
-    mock_cbs.get_neighborhood_stats = AsyncMock(
-        return_value=_make_neighborhood_stats_response()
+    mock_cbs.get_neighborhood_stats = async_return(
+        _make_neighborhood_stats_response()
     )
 
     await client.get(
@@ -554,15 +529,14 @@ async def test_neighborhood_caches_by_buurt_code(mock_cbs, mock_cache_set, mock_
     assert cache_key == "neighborhood:BU0363AD07"
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 @patch("app.api.address.cbs")
 async def test_neighborhood_does_not_cache_on_failure(
     mock_cbs, mock_cache_set, mock_cache_get, client,
 ):
-    mock_cbs.get_neighborhood_stats = AsyncMock(
-        return_value=NeighborhoodStatsResponse(
+    mock_cbs.get_neighborhood_stats = async_return(
+        NeighborhoodStatsResponse(
             address_id="0363010000696734",
             message="CBS_NO_BUURT_FOUND",
         )
@@ -577,7 +551,6 @@ async def test_neighborhood_does_not_cache_on_failure(
     mock_cache_set.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_neighborhood_invalid_vbo_id(client):
     resp = await client.get(
         "/api/address/not-valid/neighborhood",
@@ -586,13 +559,11 @@ async def test_neighborhood_invalid_vbo_id(client):
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
 async def test_neighborhood_missing_params(client):
     resp = await client.get("/api/address/0363010000696734/neighborhood")
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
 @patch("app.api.address.cache_get", new_callable=AsyncMock, return_value=None)
 @patch("app.api.address.cache_set", new_callable=AsyncMock)
 async def test_neighborhood_returns_502_on_exception(
@@ -1,7 +1,9 @@
 import re
 
+import orjson
 import pytest
 
+import app.services.bag as bag_module
 from app.services.bag import (
     GEBRUIKSDOEL_TRANSLATIONS,
     STATUS_TRANSLATIONS,
@@ -11,6 +13,90 @@ from app.services.bag import (
     get_building_facts,
 )
 
+EXPECTED_STATUSES = (
+    "Pand in gebruik",
+    "Pand in gebruik (niet ingemeten)",
+    "Pand buiten gebruik",
+    "Verbouwing pand",
+    "Sloopvergunning verleend",
+    "Pand gesloopt",
+    "Bouwvergunning verleend",
+    "Bouw gestart",
+    "Niet gerealiseerd pand",
+    "Pand ten onrechte opgevoerd",
+)
+
+EXPECTED_GEBRUIKSDOEL = (
+    "woonfunctie",
+    "bijeenkomstfunctie",
+    "celfunctie",
+    "gezondheidszorgfunctie",
+    "industriefunctie",
+    "kantoorfunctie",
+    "logiesfunctie",
+    "onderwijsfunctie",
+    "sportfunctie",
+    "winkelfunctie",
+    "overige gebruiksfunctie",
+)
+
+
+# Mocked WFS payloads are serialized once at import instead of per request match.
+_JSON_HEADERS = {"content-type": "application/json"}
+_VBO_URL_RE = re.compile(r".*typeName=bag%3Averblijfsobject.*|.*typeName=bag:verblijfsobject.*")
+_PAND_URL_RE = re.compile(r".*typeName=bag%3Apand.*|.*typeName=bag:pand.*")
+
+_VBO_BODY = orjson.dumps({
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {
+                "identificatie": "0363010000696734",
+                "oppervlakte": 143,
+                "status": "Verblijfsobject in gebruik",
+                "gebruiksdoel": "winkelfunctie,woonfunctie",
+                "bouwjaar": 1917,
+                "pandidentificatie": "0363100012253924",
+                "pandstatus": "Pand in gebruik",
+            },
+            "geometry": {"type": "Point", "coordinates": [121286.0, 487296.0]},
+        }
+    ],
+})
+
+_PAND_BODY = orjson.dumps({
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {
+                "identificatie": "0363100012253924",
+                "bouwjaar": 1917,
+                "status": "Pand in gebruik",
+                "gebruiksdoel": "winkelfunctie,woonfunctie",
+                "aantal_verblijfsobjecten": 3,
+            },
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [
+                    [[4.892, 52.372], [4.893, 52.372], [4.893, 52.373], [4.892, 52.372]]
+                ],
+            },
+        }
+    ],
+})
+
+_EMPTY_BODY = orjson.dumps({"type": "FeatureCollection", "features": []})
+
+
+@pytest.fixture
+def reset_bag_client():
+    """Drop the cached httpx client so httpx_mock intercepts a fresh one."""
+    bag_module._client = None
+    yield
+    bag_module._client = None
+
 
 def test_translate_status_known():
     assert _translate_status("Pand in gebruik") == "In use"
@@ -50,96 +136,21 @@ def test_translate_gebruiksdoel_none():
     assert en == []
 
 
-def test_all_statuses_have_translations():
+@pytest.mark.parametrize("status", EXPECTED_STATUSES)
+def test_status_has_translation(status):
     """All known pand statuses must have English translations."""
-    expected_statuses = [
-        "Pand in gebruik",
-        "Pand in gebruik (niet ingemeten)",
-        "Pand buiten gebruik",
-        "Verbouwing pand",
-        "Sloopvergunning verleend",
-        "Pand gesloopt",
-        "Bouwvergunning verleend",
-        "Bouw gestart",
-        "Niet gerealiseerd pand",
-        "Pand ten onrechte opgevoerd",
-    ]
-    for status in expected_statuses:
-        assert status in STATUS_TRANSLATIONS, f"Missing translation for: {status}"
-
-
-def test_all_gebruiksdoel_have_translations():
+    assert status in STATUS_TRANSLATIONS, f"Missing translation for: {status}"
+
+
+@pytest.mark.parametrize("doel", EXPECTED_GEBRUIKSDOEL)
+def test_gebruiksdoel_has_translation(doel):
     """All known gebruiksdoel values must have English translations."""
-    expected = [
-        "woonfunctie",
-        "bijeenkomstfunctie",
-        "celfunctie",
-        "gezondheidszorgfunctie",
-        "industriefunctie",
-        "kantoorfunctie",
-        "logiesfunctie",
-        "onderwijsfunctie",
-        "sportfunctie",
-        "winkelfunctie",
-        "overige gebruiksfunctie",
-    ]
-    for doel in expected:
-        assert doel in GEBRUIKSDOEL_TRANSLATIONS, f"Missing translation for: {doel}"
-
-
-@pytest.mark.asyncio
-async def test_get_building_facts(httpx_mock):
-    # Mock VBO response
-    httpx_mock.add_response(
-        url=re.compile(r".*typeName=bag%3Averblijfsobject.*|.*typeName=bag:verblijfsobject.*"),
-        json={
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "identificatie": "0363010000696734",
-                        "oppervlakte": 143,
-                        "status": "Verblijfsobject in gebruik",
-                        "gebruiksdoel": "winkelfunctie,woonfunctie",
-                        "bouwjaar": 1917,
-                        "pandidentificatie": "0363100012253924",
-                        "pandstatus": "Pand in gebruik",
-                    },
-                    "geometry": {"type": "Point", "coordinates": [121286.0, 487296.0]},
-                }
-            ],
-        },
-    )
-
-    # Mock pand response
-    httpx_mock.add_response(
-        url=re.compile(r".*typeName=bag%3Apand.*|.*typeName=bag:pand.*"),
-        json={
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "identificatie": "0363100012253924",
-                        "bouwjaar": 1917,
-                        "status": "Pand in gebruik",
-                        "gebruiksdoel": "winkelfunctie,woonfunctie",
-                        "aantal_verblijfsobjecten": 3,
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [
-                            [[4.892, 52.372], [4.893, 52.372], [4.893, 52.373], [4.892, 52.372]]
-                        ],
-                    },
-                }
-            ],
-        },
-    )
-
-    import app.services.bag as bag_module
-    bag_module._client = None
+    assert doel in GEBRUIKSDOEL_TRANSLATIONS, f"Missing translation for: {doel}"
+
+
+async def test_get_building_facts(httpx_mock, reset_bag_client):
+    httpx_mock.add_response(url=_VBO_URL_RE, content=_VBO_BODY, headers=_JSON_HEADERS)
+    httpx_mock.add_response(url=_PAND_URL_RE, content=_PAND_BODY, headers=_JSON_HEADERS)
 
     result = await get_building_facts("0363010000696734")
 
@@ -155,26 +166,14 @@ async def test_get_building_facts(httpx_mock):
     assert result.footprint_geojson is not None
     assert result.footprint_geojson["type"] == "Polygon"
 
-    bag_module._client = None
-
 
-@pytest.mark.asyncio
-async def test_get_building_facts_no_vbo(httpx_mock):
-    httpx_mock.add_response(
-        url=re.compile(r".*typeName=bag%3Averblijfsobject.*|.*typeName=bag:verblijfsobject.*"),
-        json={"type": "FeatureCollection", "features": []},
-    )
-
-    import app.services.bag as bag_module
-    bag_module._client = None
+async def test_get_building_facts_no_vbo(httpx_mock, reset_bag_client):
+    httpx_mock.add_response(url=_VBO_URL_RE, content=_EMPTY_BODY, headers=_JSON_HEADERS)
 
     result = await get_building_facts("0000000000000000")
     assert result is None
 
-    bag_module._client = None
-
 
-@pytest.mark.asyncio
 async def test_get_building_facts_invalid_id():
     with pytest.raises(ValueError, match="Invalid BAG VBO ID"):
         await get_building_facts("nonexistent")
@@ -1,5 +1,6 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pytest
 
 from app.models.neighborhood import (
@@ -9,50 +10,35 @@ from app.models.neighborhood import (
 from app.services.cbs import (
     _fetch_by_bbox,
     _fetch_by_buurt_code,
-    _geometry_contains_point,
+    _first_containing,
     _is_sentinel,
     _make_indicator,
     _parse_age_profile,
     _parse_stats,
     _parse_urbanization,
+    _pip_bulk,
     _safe_float,
     get_neighborhood_stats,
 )
 
 # --- Sentinel detection ---
 
-def test_is_sentinel_rejects_large_negative():
-    assert _is_sentinel(-99999) is True
-
-
-def test_is_sentinel_rejects_none():
-    assert _is_sentinel(None) is True
-
-
-def test_is_sentinel_rejects_string():
-    assert _is_sentinel("n/a") is True
-
-
-def test_is_sentinel_accepts_zero():
-    assert _is_sentinel(0) is False
-
-
-def test_is_sentinel_accepts_positive():
-    assert _is_sentinel(42.5) is False
+@pytest.mark.parametrize(
+    "value, expected",
+    [(-99999, True), (None, True), ("n/a", True), (0, False), (42.5, False)],
+)
+def test_is_sentinel(value, expected):
+    assert _is_sentinel(value) is expected
 
 
 # --- safe_float ---
 
-def test_safe_float_returns_value():
-    assert _safe_float({"x": 12.5}, "x") == 12.5
-
-
-def test_safe_float_returns_none_for_sentinel():
-    assert _safe_float({"x": -99999}, "x") is None
-
-
-def test_safe_float_returns_none_for_missing_key():
-    assert _safe_float({}, "x") is None
+@pytest.mark.parametrize(
+    "props, expected",
+    [({"x": 12.5}, 12.5), ({"x": -99999}, None), ({}, None)],
+)
+def test_safe_float(props, expected):
+    assert _safe_float(props, "x") == expected
 
 
 # --- make_indicator ---
@@ -72,27 +58,19 @@ def test_make_indicator_unavailable():
 
 # --- urbanization ---
 
-def test_parse_urbanization_very_urban():
-    props = {"stedelijkheid_adressen_per_km2": 1}
-    assert _parse_urbanization(props) == UrbanizationLevel.very_urban
-
-
-def test_parse_urbanization_very_rural():
-    props = {"stedelijkheid_adressen_per_km2": 5}
-    assert _parse_urbanization(props) == UrbanizationLevel.very_rural
-
-
-def test_parse_urbanization_unknown_for_sentinel():
-    props = {"stedelijkheid_adressen_per_km2": -99999}
-    assert _parse_urbanization(props) == UrbanizationLevel.unknown
-
-
-def test_parse_urbanization_unknown_for_missing():
-    assert _parse_urbanization({}) == UrbanizationLevel.unknown
-
-
-def test_parse_urbanization_unknown_for_out_of_range():
-    assert _parse_urbanization({"stedelijkheid_adressen_per_km2": 99}) == UrbanizationLevel.unknown
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1, UrbanizationLevel.very_urban),
+        (5, UrbanizationLevel.very_rural),
+        (-99999, UrbanizationLevel.unknown),
+        (None, UrbanizationLevel.unknown),
+        (99, UrbanizationLevel.unknown),
+    ],
+)
+def test_parse_urbanization(value, expected):
+    props = {} if value is None else {"stedelijkheid_adressen_per_km2": value}
+    assert _parse_urbanization(props) == expected
 
 
 # --- age profile ---
@@ -128,31 +106,8 @@ def test_parse_age_profile_with_sentinels():
 
 # --- full stats parsing ---
 
-def _make_full_feature() -> dict:
-    return {
-        "properties": {
-            "buurtcode": "BU0363AD07",
-            "buurtnaam": "Centrum-Oost",
-            "gemeentenaam": "Amsterdam",
-            "bevolkingsdichtheid_inwoners_per_km2": 15000,
-            "gemiddelde_huishoudsgrootte": 1.8,
-            "percentage_eenpersoonshuishoudens": 55.0,
-            "percentage_personen_0_tot_15_jaar": 8.0,
-            "percentage_personen_15_tot_25_jaar": 10.0,
-            "percentage_personen_25_tot_45_jaar": 40.0,
-            "percentage_personen_45_tot_65_jaar": 25.0,
-            "percentage_personen_65_jaar_en_ouder": 17.0,
-            "percentage_koopwoningen": 35.0,
-            "gemiddelde_woningwaarde": 520000,
-            "treinstation_gemiddelde_afstand_in_km": 0.8,
-            "grote_supermarkt_gemiddelde_afstand_in_km": 0.3,
-            "stedelijkheid_adressen_per_km2": 1,
-        }
-    }
-
-
-def test_parse_stats_full():
-    stats = _parse_stats(_make_full_feature())
+def test_parse_stats_full(full_feature):
+    stats = _parse_stats(full_feature)
     assert isinstance(stats, NeighborhoodStats)
     assert stats.buurt_code == "BU0363AD07"
     assert stats.buurt_name == "Centrum-Oost"
@@ -176,8 +131,8 @@ def test_parse_stats_returns_none_without_buurtcode():
     assert _parse_stats(feature) is None
 
 
-def test_parse_stats_suppressed_fields():
-    feature = _make_full_feature()
+def test_parse_stats_suppressed_fields(full_feature_factory):
+    feature = full_feature_factory()
     feature["properties"]["percentage_koopwoningen"] = -99999
     feature["properties"]["gemiddelde_woningwaarde"] = -99999
     stats = _parse_stats(feature)
@@ -190,71 +145,86 @@ def test_parse_stats_suppressed_fields():
 
 # --- geometry point-in-polygon ---
 
-def test_geometry_contains_point_polygon():
-    geom = {
-        "type": "Polygon",
-        "coordinates": [[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]],
-    }
-    assert _geometry_contains_point(geom, 5, 5) is True
-    assert _geometry_contains_point(geom, 15, 5) is False
+_SQUARE = [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]
+_TWO_SQUARES = [
+    [[[0, 0], [5, 0], [5, 5], [0, 5], [0, 0]]],
+    [[[10, 10], [20, 10], [20, 20], [10, 20], [10, 10]]],
+]
 
 
-def test_geometry_contains_point_multipolygon():
-    geom = {
-        "type": "MultiPolygon",
-        "coordinates": [
-            [[[0, 0], [5, 0], [5, 5], [0, 5], [0, 0]]],
-            [[[10, 10], [20, 10], [20, 20], [10, 20], [10, 10]]],
-        ],
-    }
-    assert _geometry_contains_point(geom, 15, 15) is True
-    assert _geometry_contains_point(geom, 7, 7) is False
+def _feature(geom):
+    return {"geometry": geom}
 
 
-def test_geometry_contains_point_none():
-    assert _geometry_contains_point(None, 5, 5) is False
+def test_first_containing_polygon():
+    feat = _feature({"type": "Polygon", "coordinates": [_SQUARE]})
+    assert _first_containing([feat], 5, 5) is feat
+    assert _first_containing([feat], 15, 5) is None
 
 
-# --- fetch_by_buurt_code ---
+def test_first_containing_multipolygon():
+    feat = _feature({"type": "MultiPolygon", "coordinates": _TWO_SQUARES})
+    assert _first_containing([feat], 15, 15) is feat
+    assert _first_containing([feat], 7, 7) is None
+
+
+def test_first_containing_skips_missing_geometry():
+    inside = _feature({"type": "Polygon", "coordinates": [_SQUARE]})
+    assert _first_containing([_feature(None), inside], 5, 5) is inside
+
 
-@pytest.mark.asyncio
-async def test_fetch_by_buurt_code_returns_feature():
-    mock_resp = MagicMock()
-    mock_resp.raise_for_status = MagicMock()
-    mock_resp.json.return_value = {"features": [_make_full_feature()]}
+def test_first_containing_caches_bbox():
+    geom = {"type": "MultiPolygon", "coordinates": _TWO_SQUARES}
+    assert _first_containing([_feature(geom)], 25, 5) is None
+    assert geom["_bbox"] == (0.0, 0.0, 20.0, 20.0)
+    assert geom["_ring_bboxes"].tolist() == [[0, 0, 5, 5], [10, 10, 20, 20]]
 
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_resp)
 
-    with patch("app.services.cbs._get_client", return_value=mock_client):
-        result = await _fetch_by_buurt_code("BU0363AD07")
+@pytest.mark.parametrize(
+    "x, y, expected",
+    [(2, 2, True), (5, 6, False), (5, 3, True), (11, 5, False), (8, 7, True)],
+)
+def test_first_containing_concave_ring(x, y, expected):
+    ring = [[0, 0], [10, 0], [10, 10], [5, 4], [0, 10], [0, 0]]
+    feat = _feature({"type": "Polygon", "coordinates": [ring]})
+    assert (_first_containing([feat], x, y) is feat) is expected
+
+
+def test_pip_bulk_per_ring_parity():
+    square = [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]
+    shifted = [[5, 5], [15, 5], [15, 15], [5, 15]]
+    far = [[20, 20], [30, 20], [30, 30], [20, 30], [20, 20]]
+    points = np.array(square + shifted + far, dtype=np.float64)
+    starts = np.array([0, 5, 9, 14])
+    assert _pip_bulk(points, starts, 7, 7).tolist() == [True, True, False]
+    assert _pip_bulk(points, starts, 12, 12).tolist() == [False, True, False]
+
+
+# --- fetch_by_buurt_code ---
+
+async def test_fetch_by_buurt_code_returns_feature(mock_cbs_response, full_feature):
+    client, _ = mock_cbs_response({"features": [full_feature]})
+
+    result = await _fetch_by_buurt_code("BU0363AD07")
 
     assert result is not None
     assert result["properties"]["buurtcode"] == "BU0363AD07"
-    call_args = mock_client.get.call_args
+    call_args = client.get.call_args
     assert "buurtcode" in call_args.kwargs.get("params", call_args[1].get("params", {}))
 
 
-@pytest.mark.asyncio
-async def test_fetch_by_buurt_code_empty():
-    mock_resp = MagicMock()
-    mock_resp.raise_for_status = MagicMock()
-    mock_resp.json.return_value = {"features": []}
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_resp)
+async def test_fetch_by_buurt_code_empty(mock_cbs_response):
+    mock_cbs_response({"features": []})
 
-    with patch("app.services.cbs._get_client", return_value=mock_client):
-        result = await _fetch_by_buurt_code("BU0000XX00")
+    result = await _fetch_by_buurt_code("BU0000XX00")
 
     assert result is None
 
 
 # --- fetch_by_bbox ---
 
-@pytest.mark.asyncio
-async def test_fetch_by_bbox_with_point_in_polygon():
-    feature_inside = _make_full_feature()
+async def test_fetch_by_bbox_with_point_in_polygon(mock_cbs_response, full_feature_factory):
+    feature_inside = full_feature_factory()
     feature_inside["geometry"] = {
         "type": "Polygon",
         "coordinates": [[
@@ -270,44 +240,29 @@ async def test_fetch_by_bbox_with_point_in_polygon():
         },
     }
 
-    mock_resp = MagicMock()
-    mock_resp.raise_for_status = MagicMock()
-    mock_resp.json.return_value = {"features": [feature_outside, feature_inside]}
+    mock_cbs_response({"features": [feature_outside, feature_inside]})
 
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_resp)
-
-    with patch("app.services.cbs._get_client", return_value=mock_client):
-        result = await _fetch_by_bbox(52.37, 4.89)
+    result = await _fetch_by_bbox(52.37, 4.89)
 
     assert result is not None
     assert result["properties"]["buurtcode"] == "BU0363AD07"
 
 
-@pytest.mark.asyncio
-async def test_fetch_by_bbox_fallback_first_feature():
+async def test_fetch_by_bbox_fallback_first_feature(mock_cbs_response, full_feature):
     """When no geometry matches, falls back to first feature."""
-    feature = _make_full_feature()
     # No geometry field
-    mock_resp = MagicMock()
-    mock_resp.raise_for_status = MagicMock()
-    mock_resp.json.return_value = {"features": [feature]}
-
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_resp)
+    mock_cbs_response({"features": [full_feature]})
 
-    with patch("app.services.cbs._get_client", return_value=mock_client):
-        result = await _fetch_by_bbox(52.37, 4.89)
+    result = await _fetch_by_bbox(52.37, 4.89)
 
     assert result is not None
 
 
 # --- orchestrator ---
 
-@pytest.mark.asyncio
-async def test_get_neighborhood_stats_by_buurt_code():
+async def test_get_neighborhood_stats_by_buurt_code(full_feature):
     with patch("app.services.cbs._fetch_by_buurt_code", new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.return_value = _make_full_feature()
+        mock_fetch.return_value = full_feature
         result = await get_neighborhood_stats(
             vbo_id="0363010000696734",
             lat=52.37,
@@ -320,14 +275,13 @@ async def test_get_neighborhood_stats_by_buurt_code():
     assert result.message is None
 
 
-@pytest.mark.asyncio
-async def test_get_neighborhood_stats_fallback_to_bbox():
+async def test_get_neighborhood_stats_fallback_to_bbox(full_feature):
     with (
         patch("app.services.cbs._fetch_by_buurt_code", new_callable=AsyncMock) as mock_bc,
         patch("app.services.cbs._fetch_by_bbox", new_callable=AsyncMock) as mock_bbox,
     ):
         mock_bc.return_value = None  # buurt_code lookup returns nothing
-        mock_bbox.return_value = _make_full_feature()
+        mock_bbox.return_value = full_feature
         result = await get_neighborhood_stats(
             vbo_id="0363010000696734",
             lat=52.37,
@@ -338,11 +292,10 @@ async def test_get_neighborhood_stats_fallback_to_bbox():
     assert result.stats is not None
 
 
-@pytest.mark.asyncio
-async def test_get_neighborhood_stats_bbox_only():
+async def test_get_neighborhood_stats_bbox_only(full_feature):
     """When no buurt_code provided, goes directly to bbox."""
     with patch("app.services.cbs._fetch_by_bbox", new_callable=AsyncMock) as mock_bbox:
-        mock_bbox.return_value = _make_full_feature()
+        mock_bbox.return_value = full_feature
         result = await get_neighborhood_stats(
             vbo_id="0363010000696734",
             lat=52.37,
@@ -353,7 +306,6 @@ async def test_get_neighborhood_stats_bbox_only():
     mock_bbox.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_neighborhood_stats_no_buurt_found():
     with (
         patch("app.services.cbs._fetch_by_buurt_code", new_callable=AsyncMock, return_value=None),
@@ -370,7 +322,6 @@ async def test_get_neighborhood_stats_no_buurt_found():
     assert result.message == "CBS_NO_BUURT_FOUND"
 
 
-@pytest.mark.asyncio
 async def test_get_neighborhood_stats_bbox_exception():
     mock_bbox = AsyncMock(side_effect=Exception("timeout"))
     with patch("app.services.cbs._fetch_by_bbox", mock_bbox):
@@ -384,8 +335,7 @@ async def test_get_neighborhood_stats_bbox_exception():
     assert result.message == "CBS_LOOKUP_FAILED"
 
 
-@pytest.mark.asyncio
-async def test_get_neighborhood_stats_buurt_code_exception_falls_back():
+async def test_get_neighborhood_stats_buurt_code_exception_falls_back(full_feature):
     """If buurt_code fetch raises, falls back to bbox."""
     with (
         patch(
@@ -395,7 +345,7 @@ async def test_get_neighborhood_stats_buurt_code_exception_falls_back():
         ),
         patch("app.services.cbs._fetch_by_bbox", new_callable=AsyncMock) as mock_bbox,
     ):
-        mock_bbox.return_value = _make_full_feature()
+        mock_bbox.return_value = full_feature
         result = await get_neighborhood_stats(
             vbo_id="0363010000696734",
             lat=52.37,
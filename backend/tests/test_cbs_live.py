@@ -13,7 +13,6 @@ from app.services import cbs
 pytestmark = pytest.mark.live
 
 
-@pytest.mark.asyncio
 async def test_cbs_amsterdam_centrum_by_buurt_code():
     """Verify CBS lookup by buurt_code returns valid data."""
     result = await cbs.get_neighborhood_stats(
@@ -31,7 +30,6 @@ async def test_cbs_amsterdam_centrum_by_buurt_code():
     assert result.stats.urbanization is not None
 
 
-@pytest.mark.asyncio
 async def test_cbs_amsterdam_bbox_fallback():
     """Verify CBS bbox lookup works when buurt_code not provided."""
     result = await cbs.get_neighborhood_stats(
@@ -43,7 +41,6 @@ async def test_cbs_amsterdam_bbox_fallback():
     assert result.stats.buurt_name is not None
 
 
-@pytest.mark.asyncio
 async def test_cbs_rotterdam():
     """Verify CBS works in different city (Rotterdam)."""
     result = await cbs.get_neighborhood_stats(
@@ -56,7 +53,6 @@ async def test_cbs_rotterdam():
     assert result.stats.gemeente_name == "Rotterdam"
 
 
-@pytest.mark.asyncio
 async def test_cbs_response_structure():
     """Verify all expected fields are present in live response."""
     result = await cbs.get_neighborhood_stats(
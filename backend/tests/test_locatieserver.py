@@ -1,63 +1,125 @@
+import re
+
+import httpx
+import orjson
 import pytest
 
+import app.services.locatieserver as ls
+from app.config import settings
 from app.services.locatieserver import _parse_wkt_point, lookup, suggest
 
+_SUGGEST_BODY = orjson.dumps({
+    "response": {
+        "numFound": 2,
+        "start": 0,
+        "maxScore": 7.5,
+        "docs": [
+            {
+                "type": "adres",
+                "weergavenaam": "Kalverstraat 1, 1012NX Amsterdam",
+                "id": "adr-abc123",
+                "score": 7.5,
+            },
+            {
+                "type": "adres",
+                "weergavenaam": "Kalverstraat 10, 1012NX Amsterdam",
+                "id": "adr-def456",
+                "score": 6.0,
+            },
+        ],
+    },
+    "highlighting": {
+        "adr-abc123": {"suggest": ["<b>Kalverstraat</b> <b>1</b>, Amsterdam"]},
+        "adr-def456": {"suggest": ["<b>Kalverstraat</b> 10, Amsterdam"]},
+    },
+})
+_SUGGEST_EMPTY_BODY = orjson.dumps({
+    "response": {"numFound": 0, "start": 0, "maxScore": 0, "docs": []},
+    "highlighting": {},
+})
+_LOOKUP_BODY = orjson.dumps({
+    "response": {
+        "numFound": 1,
+        "docs": [
+            {
+                "id": "adr-abc123",
+                "nummeraanduiding_id": "0363200000158443",
+                "adresseerbaarobject_id": "0363010000696734",
+                "weergavenaam": "Kalverstraat 1, 1012NX Amsterdam",
+                "straatnaam": "Kalverstraat",
+                "huisnummer": 1,
+                "postcode": "1012NX",
+                "woonplaatsnaam": "Amsterdam",
+                "gemeentenaam": "Amsterdam",
+                "provincienaam": "Noord-Holland",
+                "centroide_ll": "POINT(4.89214036 52.37250408)",
+                "centroide_rd": "POINT(121286 487296)",
+                "buurtcode": "BU0363AD07",
+                "wijkcode": "WK0363AD",
+            }
+        ],
+    }
+})
+_LOOKUP_EMPTY_BODY = orjson.dumps({"response": {"numFound": 0, "docs": []}})
+_LOOKUP_TOEVOEGING_BODY = orjson.dumps({
+    "response": {
+        "numFound": 1,
+        "docs": [
+            {
+                "id": "adr-toev",
+                "weergavenaam": "Keizersgracht 100-3, Amsterdam",
+                "straatnaam": "Keizersgracht",
+                "huisnummer": 100,
+                "huisnummertoevoeging": "3",
+                "postcode": "1015AA",
+                "woonplaatsnaam": "Amsterdam",
+                "centroide_ll": "POINT(4.884 52.367)",
+                "centroide_rd": "POINT(121000 487000)",
+            }
+        ],
+    }
+})
+_JSON_HEADERS = {"content-type": "application/json"}
 
-def test_parse_wkt_point_valid():
-    result = _parse_wkt_point("POINT(4.89214036 52.37250408)")
-    assert result == (4.89214036, 52.37250408)
-
-
-def test_parse_wkt_point_rd():
-    result = _parse_wkt_point("POINT(121286 487296)")
-    assert result == (121286.0, 487296.0)
 
+@pytest.fixture
+async def ls_routes(monkeypatch):
+    """Install a MockTransport client; tests map endpoint name to response bytes."""
+    routes: dict[str, bytes] = {}
 
-def test_parse_wkt_point_none():
-    assert _parse_wkt_point(None) is None
+    def handler(request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, content=routes[endpoint], headers=_JSON_HEADERS)
 
+    client = httpx.AsyncClient(
+        base_url=settings.locatieserver_base,
+        transport=httpx.MockTransport(handler),
+    )
+    monkeypatch.setattr(ls, "_client", client)
+    yield routes
+    await client.aclose()
 
-def test_parse_wkt_point_empty():
-    assert _parse_wkt_point("") is None
 
+@pytest.mark.parametrize(
+    "wkt, expected",
+    [
+        ("POINT(4.89214036 52.37250408)", (4.89214036, 52.37250408)),
+        ("POINT(121286 487296)", (121286.0, 487296.0)),
+        (None, None),
+        ("", None),
+        ("not a point", None),
+    ],
+)
+def test_parse_wkt_point(wkt, expected):
+    assert _parse_wkt_point(wkt) == expected
 
-def test_parse_wkt_point_invalid():
-    assert _parse_wkt_point("not a point") is None
 
+def test_wkt_point_pattern_is_precompiled():
+    assert isinstance(ls._WKT_POINT, re.Pattern)
 
-@pytest.mark.asyncio
-async def test_suggest_returns_suggestions(httpx_mock):
-    httpx_mock.add_response(
-        json={
-            "response": {
-                "numFound": 2,
-                "start": 0,
-                "maxScore": 7.5,
-                "docs": [
-                    {
-                        "type": "adres",
-                        "weergavenaam": "Kalverstraat 1, 1012NX Amsterdam",
-                        "id": "adr-abc123",
-                        "score": 7.5,
-                    },
-                    {
-                        "type": "adres",
-                        "weergavenaam": "Kalverstraat 10, 1012NX Amsterdam",
-                        "id": "adr-def456",
-                        "score": 6.0,
-                    },
-                ],
-            },
-            "highlighting": {
-                "adr-abc123": {"suggest": ["<b>Kalverstraat</b> <b>1</b>, Amsterdam"]},
-                "adr-def456": {"suggest": ["<b>Kalverstraat</b> 10, Amsterdam"]},
-            },
-        }
-    )
 
-    # Reset the client so httpx_mock is used
-    import app.services.locatieserver as ls
-    ls._client = None
+async def test_suggest_returns_suggestions(ls_routes):
+    ls_routes["suggest"] = _SUGGEST_BODY
 
     results = await suggest("kalverstraat 1 amsterdam", limit=5)
     assert len(results) == 2
@@ -65,57 +127,16 @@ async def test_suggest_returns_suggestions(httpx_mock):
     assert results[0].display_name == "Kalverstraat 1, 1012NX Amsterdam"
     assert results[0].score == 7.5
 
-    ls._client = None
 
-
-@pytest.mark.asyncio
-async def test_suggest_empty_results(httpx_mock):
-    httpx_mock.add_response(
-        json={
-            "response": {"numFound": 0, "start": 0, "maxScore": 0, "docs": []},
-            "highlighting": {},
-        }
-    )
-
-    import app.services.locatieserver as ls
-    ls._client = None
+async def test_suggest_empty_results(ls_routes):
+    ls_routes["suggest"] = _SUGGEST_EMPTY_BODY
 
     results = await suggest("xyznonexistent")
     assert results == []
 
-    ls._client = None
-
-
-@pytest.mark.asyncio
-async def test_lookup_returns_address(httpx_mock):
-    httpx_mock.add_response(
-        json={
-            "response": {
-                "numFound": 1,
-                "docs": [
-                    {
-                        "id": "adr-abc123",
-                        "nummeraanduiding_id": "0363200000158443",
-                        "adresseerbaarobject_id": "0363010000696734",
-                        "weergavenaam": "Kalverstraat 1, 1012NX Amsterdam",
-                        "straatnaam": "Kalverstraat",
-                        "huisnummer": 1,
-                        "postcode": "1012NX",
-                        "woonplaatsnaam": "Amsterdam",
-                        "gemeentenaam": "Amsterdam",
-                        "provincienaam": "Noord-Holland",
-                        "centroide_ll": "POINT(4.89214036 52.37250408)",
-                        "centroide_rd": "POINT(121286 487296)",
-                        "buurtcode": "BU0363AD07",
-                        "wijkcode": "WK0363AD",
-                    }
-                ],
-            }
-        }
-    )
 
-    import app.services.locatieserver as ls
-    ls._client = None
+async def test_lookup_returns_address(ls_routes):
+    ls_routes["lookup"] = _LOOKUP_BODY
 
     result = await lookup("adr-abc123")
     assert result is not None
@@ -127,52 +148,17 @@ async def test_lookup_returns_address(httpx_mock):
     assert result.rd_y == 487296.0
     assert result.adresseerbaar_object_id == "0363010000696734"
 
-    ls._client = None
 
-
-@pytest.mark.asyncio
-async def test_lookup_not_found(httpx_mock):
-    httpx_mock.add_response(
-        json={"response": {"numFound": 0, "docs": []}}
-    )
-
-    import app.services.locatieserver as ls
-    ls._client = None
+async def test_lookup_not_found(ls_routes):
+    ls_routes["lookup"] = _LOOKUP_EMPTY_BODY
 
     result = await lookup("adr-nonexistent")
     assert result is None
 
-    ls._client = None
-
-
-@pytest.mark.asyncio
-async def test_lookup_maps_huisnummertoevoeging(httpx_mock):
-    httpx_mock.add_response(
-        json={
-            "response": {
-                "numFound": 1,
-                "docs": [
-                    {
-                        "id": "adr-toev",
-                        "weergavenaam": "Keizersgracht 100-3, Amsterdam",
-                        "straatnaam": "Keizersgracht",
-                        "huisnummer": 100,
-                        "huisnummertoevoeging": "3",
-                        "postcode": "1015AA",
-                        "woonplaatsnaam": "Amsterdam",
-                        "centroide_ll": "POINT(4.884 52.367)",
-                        "centroide_rd": "POINT(121000 487000)",
-                    }
-                ],
-            }
-        }
-    )
 
-    import app.services.locatieserver as ls
-    ls._client = None
+async def test_lookup_maps_huisnummertoevoeging(ls_routes):
+    ls_routes["lookup"] = _LOOKUP_TOEVOEGING_BODY
 
     result = await lookup("adr-toev")
     assert result is not None
     assert result.addition == "3"
-
-    ls._client = None
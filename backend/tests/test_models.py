@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from app.models.address import AddressSuggestion, ResolvedAddress
 from app.models.building import BuildingFacts, BuildingFactsResponse
 from app.models.neighborhood3d import BuildingBlock, Neighborhood3DCenter, Neighborhood3DResponse
@@ -9,6 +12,13 @@ from app.models.risk import (
     RiskLevel,
 )
 
+LOW, MEDIUM, HIGH, UNAVAIL = (
+    RiskLevel.low,
+    RiskLevel.medium,
+    RiskLevel.high,
+    RiskLevel.unavailable,
+)
+
 
 def test_address_suggestion_minimal():
     s = AddressSuggestion(id="abc", display_name="Test", type="adres", score=1.0)
@@ -23,8 +33,15 @@ def test_resolved_address_minimal():
     assert addr.postcode is None
 
 
-def test_resolved_address_full():
-    addr = ResolvedAddress(
+def test_models_are_frozen():
+    addr = ResolvedAddress(id="abc", display_name="Test 1, Amsterdam")
+    with pytest.raises(ValidationError):
+        addr.street = "Kalverstraat"
+
+
+def test_resolved_address_full(make):
+    addr = make(
+        ResolvedAddress,
         id="adr-123",
         nummeraanduiding_id="0363200000158443",
         adresseerbaar_object_id="0363010000696734",
@@ -53,8 +70,9 @@ def test_building_facts_minimal():
     assert bf.footprint_geojson is None
 
 
-def test_building_facts_full():
-    bf = BuildingFacts(
+def test_building_facts_full(make):
+    bf = make(
+        BuildingFacts,
         pand_id="0363100012253924",
         construction_year=1917,
         status="Pand in gebruik",
@@ -81,21 +99,23 @@ def test_building_facts_response_with_no_building():
     assert resp.message == "No building found"
 
 
-def test_building_facts_response_with_building():
-    resp = BuildingFactsResponse(
+def test_building_facts_response_with_building(make):
+    resp = make(
+        BuildingFactsResponse,
         address_id="0363010000696734",
-        building=BuildingFacts(pand_id="0363100012253924", construction_year=1917),
+        building=make(BuildingFacts, pand_id="0363100012253924", construction_year=1917),
     )
     assert resp.building is not None
     assert resp.building.construction_year == 1917
 
 
-def test_building_block():
-    b = BuildingBlock(
+def test_building_block(make):
+    b = make(
+        BuildingBlock,
         pand_id="0363100012253924",
         ground_height=1.75,
         building_height=16.43,
-        footprint=[[0.0, 0.0], [5.2, 0.0], [5.2, 4.8], [0.0, 4.8]],
+        footprint=[(0.0, 0.0), (5.2, 0.0), (5.2, 4.8), (0.0, 4.8)],
         year=1917,
     )
     assert b.pand_id == "0363100012253924"
@@ -109,22 +129,24 @@ def test_building_block_no_year():
         pand_id="0363100012253924",
         ground_height=0.0,
         building_height=10.0,
-        footprint=[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0]],
+        footprint=[(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)],
     )
     assert b.year is None
 
 
-def test_neighborhood_3d_response():
-    resp = Neighborhood3DResponse(
+def test_neighborhood_3d_response(make):
+    resp = make(
+        Neighborhood3DResponse,
         address_id="0363010000696734",
         target_pand_id="0363100012253924",
-        center=Neighborhood3DCenter(lat=52.372, lng=4.892, rd_x=121286.0, rd_y=487296.0),
+        center=make(Neighborhood3DCenter, lat=52.372, lng=4.892, rd_x=121286.0, rd_y=487296.0),
         buildings=[
-            BuildingBlock(
+            make(
+                BuildingBlock,
                 pand_id="0363100012253924",
                 ground_height=1.75,
                 building_height=16.43,
-                footprint=[[0.0, 0.0], [5.0, 0.0], [5.0, 5.0], [0.0, 5.0]],
+                footprint=[(0.0, 0.0), (5.0, 0.0), (5.0, 5.0), (0.0, 5.0)],
                 year=1917,
             )
         ],
@@ -135,6 +157,26 @@ def test_neighborhood_3d_response():
     assert resp.message is None
 
 
+def test_neighborhood_3d_response_validates_nested():
+    resp = Neighborhood3DResponse(
+        address_id="0363010000696734",
+        center={"lat": "52.372", "lng": 4.892, "rd_x": 121286, "rd_y": 487296},
+        buildings=[
+            {
+                "pand_id": "0363100012253924",
+                "ground_height": 0,
+                "building_height": "10.5",
+                "footprint": [[0, 0], [1, 0], [1, 1]],
+            }
+        ],
+    )
+    assert isinstance(resp.center, Neighborhood3DCenter)
+    assert resp.center.lat == 52.372
+    assert isinstance(resp.buildings[0], BuildingBlock)
+    assert resp.buildings[0].building_height == 10.5
+    assert resp.buildings[0].footprint[1] == (1.0, 0.0)
+
+
 def test_noise_risk_card():
     card = NoiseRiskCard(
         level=RiskLevel.medium,
@@ -150,65 +192,71 @@ def test_noise_risk_card():
 
 def test_air_quality_risk_card():
     card = AirQualityRiskCard(
-        level=RiskLevel.high,
+        level=HIGH,
         pm25_ug_m3=11.2,
         no2_ug_m3=26.8,
-        pm25_level=RiskLevel.high,
-        no2_level=RiskLevel.high,
+        pm25_level=HIGH,
+        no2_level=HIGH,
         source="RIVM GCN WMS",
         source_date="2024",
         sampled_at="2026-02-05",
         pm25_layer="conc_PM25_2024",
         no2_layer="conc_NO2_2024",
     )
-    assert card.level == RiskLevel.high
-    assert card.pm25_level == RiskLevel.high
-    assert card.no2_level == RiskLevel.high
+    assert card.level == HIGH
+    assert card.pm25_level == HIGH
+    assert card.no2_level == HIGH
 
 
 def test_climate_stress_risk_card():
     card = ClimateStressRiskCard(
-        level=RiskLevel.medium,
+        level=MEDIUM,
         heat_value=0.71,
-        heat_level=RiskLevel.medium,
+        heat_level=MEDIUM,
         water_value=2.0,
-        water_level=RiskLevel.medium,
+        water_level=MEDIUM,
         source="Klimaateffectatlas WMS/WFS",
         source_date="2026-02-05",
         sampled_at="2026-02-05",
         heat_layer="wpn:s0149_hittestress_warme_nachten_huidig",
         water_layer="etten:gr1_t100",
     )
-    assert card.level == RiskLevel.medium
-    assert card.heat_level == RiskLevel.medium
-    assert card.water_level == RiskLevel.medium
+    assert card.level == MEDIUM
+    assert card.heat_level == MEDIUM
+    assert card.water_level == MEDIUM
 
 
-def test_risk_cards_response():
-    resp = RiskCardsResponse(
+def test_risk_cards_response(make):
+    resp = make(
+        RiskCardsResponse,
         address_id="0363010000696734",
-        noise=NoiseRiskCard(
-            level=RiskLevel.low,
+        noise=make(
+            NoiseRiskCard,
+            level=LOW,
             lden_db=49.3,
             source="RIVM / Atlas Leefomgeving WMS",
             sampled_at="2026-02-05",
         ),
-        air_quality=AirQualityRiskCard(
-            level=RiskLevel.medium,
+        air_quality=make(
+            AirQualityRiskCard,
+            level=MEDIUM,
             pm25_ug_m3=8.6,
             no2_ug_m3=17.5,
-            pm25_level=RiskLevel.medium,
-            no2_level=RiskLevel.medium,
+            pm25_level=MEDIUM,
+            no2_level=MEDIUM,
             source="RIVM GCN WMS",
             sampled_at="2026-02-05",
         ),
-        climate_stress=ClimateStressRiskCard(
-            level=RiskLevel.unavailable,
+        climate_stress=make(
+            ClimateStressRiskCard,
+            level=UNAVAIL,
             source="Klimaateffectatlas WMS/WFS",
             sampled_at="2026-02-05",
         ),
     )
     assert resp.address_id == "0363010000696734"
-    assert resp.noise.level == RiskLevel.low
-    assert resp.air_quality.level == RiskLevel.medium
-    assert resp.climate_stress.level == RiskLevel.unavailable
+    assert resp.noise.level == LOW
+    assert resp.air_quality.level == MEDIUM
+    assert resp.climate_stress.level == UNAVAIL
+    # Schema round-trip: the unvalidated instance must survive full validation
+    assert RiskCardsResponse.model_validate(resp.model_dump()) == resp
@@ -1,8 +1,18 @@
-from unittest.mock import AsyncMock, patch
-
+import asyncio
+import re
+import time
+from datetime import UTC, date, datetime
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
+import orjson
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
-from app.models.risk import AirQualityRiskCard, ClimateStressRiskCard, NoiseRiskCard, RiskLevel
+import app.services.risk_cards as rc
+from app.models.risk import RiskLevel
 from app.services.risk_cards import (
     _CLIMATE_HEAT_LAYERS,
     _CLIMATE_WATER_LAYERS,
@@ -16,73 +26,121 @@ from app.services.risk_cards import (
     _sample_wfs_properties,
     _select_air_layer,
     _select_noise_layer,
+    _utc_now_iso_date,
     get_risk_cards,
 )
 
+LOW, MEDIUM, HIGH, UNAVAIL = (
+    RiskLevel.low,
+    RiskLevel.medium,
+    RiskLevel.high,
+    RiskLevel.unavailable,
+)
+
+_RIVM_NOISE_LAYERS = (
+    "rivm_20220601_Geluid_lden_wegverkeer_2020",
+    "rivm_20250101_Geluid_lden_wegverkeer_2022",
+    "rivm_Geluid_lden_wegverkeer_actueel",
+    "rivm_20250101_Geluid_lnight_wegverkeer_2022",
+)
+_NOISE_DATE = re.compile(r"^rivm_(\d{8})_Geluid_lden_wegverkeer_\d{4}$")
+_GCN_AIR_LAYERS = ("conc_PM25_2023", "conc_PM25_2024", "conc_NO2_2024")
+_VBO_KWARGS = MappingProxyType({
+    "vbo_id": "0363010000696734",
+    "rd_x": 121286.0,
+    "rd_y": 487296.0,
+    "lat": 52.372,
+    "lng": 4.892,
+})
+
+
+def test_utc_now_iso_date_memoized_per_minute_and_rolls_over(monkeypatch):
+    midnight = datetime(2025, 1, 2, tzinfo=UTC).timestamp()
+    clock = [midnight - 30]
+    monkeypatch.setattr(rc, "_utc_date_cache", None)
+    monkeypatch.setattr(
+        rc, "time", SimpleNamespace(time=lambda: clock[0], monotonic=time.monotonic)
+    )
+
+    assert _utc_now_iso_date() == "2025-01-01"
+    assert rc._utc_date_cache == (int(midnight // 60) - 1, "2025-01-01")
+    clock[0] = midnight
+    assert _utc_now_iso_date() == "2025-01-02"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(10.0, LOW), (25.0, MEDIUM), (40.0, HIGH)],
+)
+def test_risk_from_threshold(value, expected):
+    assert _risk_from_threshold(value, 20.0, 30.0) == expected
+
 
-def test_risk_from_threshold():
-    assert _risk_from_threshold(10.0, 20.0, 30.0) == RiskLevel.low
-    assert _risk_from_threshold(25.0, 20.0, 30.0) == RiskLevel.medium
-    assert _risk_from_threshold(40.0, 20.0, 30.0) == RiskLevel.high
+_DATED_NOISE_LAYER = st.builds(
+    "rivm_{}_Geluid_lden_wegverkeer_{}".format,
+    st.dates(date(2015, 1, 1), date(2026, 12, 31)).map(lambda d: d.strftime("%Y%m%d")),
+    st.integers(2015, 2026),
+)
 
 
-def test_select_noise_layer_prefers_latest_date():
-    layers = [
-        "rivm_20220601_Geluid_lden_wegverkeer_2020",
-        "rivm_20250101_Geluid_lden_wegverkeer_2022",
-        "other_layer",
-    ]
+@settings(max_examples=25, deadline=None)
+@given(
+    st.lists(
+        _DATED_NOISE_LAYER | st.sampled_from(_RIVM_NOISE_LAYERS[2:] + ("other_layer",)),
+        min_size=1,
+        max_size=8,
+    )
+)
+def test_select_noise_layer_prefers_latest_date(layers):
+    dated = [layer for layer in layers if _NOISE_DATE.match(layer)]
+    selected = _select_noise_layer(layers)
+    if dated:
+        latest = max(_NOISE_DATE.match(layer).group(1) for layer in dated)
+        assert selected in dated
+        assert _NOISE_DATE.match(selected).group(1) == latest
+    else:
+        # No dated lden layer: fall back to the undated lden layer, if offered
+        undated = _RIVM_NOISE_LAYERS[2]
+        assert selected == (undated if undated in layers else None)
+
+
+def test_select_noise_layer_example_prefers_latest_date():
+    layers = (*_RIVM_NOISE_LAYERS[:2], "other_layer")
     assert _select_noise_layer(layers) == "rivm_20250101_Geluid_lden_wegverkeer_2022"
 
 
+def test_select_noise_layer_falls_back_to_undated_lden():
+    layers = _RIVM_NOISE_LAYERS[2:] + ("other_layer",)
+    assert _select_noise_layer(layers) == "rivm_Geluid_lden_wegverkeer_actueel"
+
+
 def test_select_noise_layer_matches_real_rivm_names():
     """Real RIVM ALO names use Geluid_lden_wegverkeer_YYYY pattern."""
-    layers = [
-        "rivm_20220601_Geluid_lden_wegverkeer_2020",
-        "rivm_20250101_Geluid_lden_wegverkeer_2022",
-        "rivm_Geluid_lden_wegverkeer_actueel",
-        "rivm_20250101_Geluid_lnight_wegverkeer_2022",
-    ]
-    assert _select_noise_layer(layers) == "rivm_20250101_Geluid_lden_wegverkeer_2022"
+    assert _select_noise_layer(_RIVM_NOISE_LAYERS) == "rivm_20250101_Geluid_lden_wegverkeer_2022"
 
 
 def test_select_air_layer_prefers_latest_year():
-    layers = ["conc_PM25_2023", "conc_PM25_2024", "conc_NO2_2024"]
-    assert _select_air_layer(layers, "PM25") == "conc_PM25_2024"
-    assert _select_air_layer(layers, "NO2") == "conc_NO2_2024"
+    assert _select_air_layer(_GCN_AIR_LAYERS, "PM25") == "conc_PM25_2024"
+    assert _select_air_layer(_GCN_AIR_LAYERS, "NO2") == "conc_NO2_2024"
 
 
 def test_classify_heat_from_raster_index():
-    level, value, signal = _classify_heat_from_properties(
+    assert _classify_heat_from_properties(
         {"GRAY_INDEX": 0.92},
         "wpn:s0149_hittestress_warme_nachten_huidig",
-    )
-    assert level == RiskLevel.high
-    assert value == 0.92
-    assert signal == "heat index"
+    ) == (HIGH, 0.92, "heat index")
 
 
-def test_classify_water_from_begaanbaar_text():
-    level, value, signal = _classify_water_from_properties(
-        {"Begaanbaar": "Onbegaanbaar"},
-    )
-    assert level == RiskLevel.high
-    assert value is None
-    assert signal == "Onbegaanbaar"
-
-
-def test_classify_water_from_gridcode():
-    level, value, signal = _classify_water_from_properties({"GRIDCODE": 2})
-    assert level == RiskLevel.medium
-    assert value == 2
-    assert signal == "GRIDCODE"
-
-
-def test_classify_water_from_klasse_20():
-    level, value, signal = _classify_water_from_properties({"klasse_20": 3})
-    assert level == RiskLevel.high
-    assert value == 3
-    assert signal == "klasse_20"
+@pytest.mark.parametrize(
+    "props, expected",
+    [
+        ({"Begaanbaar": "Onbegaanbaar"}, (HIGH, None, "Onbegaanbaar")),
+        ({"GRIDCODE": 2}, (MEDIUM, 2, "GRIDCODE")),
+        ({"klasse_20": 3}, (HIGH, 3, "klasse_20")),
+    ],
+)
+def test_classify_water_from_properties(props, expected):
+    assert _classify_water_from_properties(props) == expected
 
 
 def test_climate_heat_layers_include_national_first():
@@ -100,56 +158,54 @@ def test_climate_water_layers_start_with_broad_coverage_layer():
     assert first_layer == "mra_klimaatatlas:1826_mra_overstromingskans_20cm"
 
 
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._build_noise_card", new_callable=AsyncMock)
-@patch("app.services.risk_cards._build_air_card", new_callable=AsyncMock)
-@patch("app.services.risk_cards._build_climate_card", new_callable=AsyncMock)
-async def test_get_risk_cards_assembly(mock_climate, mock_air, mock_noise):
-    mock_noise.return_value = NoiseRiskCard(
-        level=RiskLevel.low,
-        lden_db=50.0,
-        source="RIVM / Atlas Leefomgeving WMS",
-        sampled_at="2026-02-05",
-    )
-    mock_air.return_value = AirQualityRiskCard(
-        level=RiskLevel.medium,
-        pm25_ug_m3=8.0,
-        no2_ug_m3=17.0,
-        pm25_level=RiskLevel.medium,
-        no2_level=RiskLevel.medium,
-        source="RIVM GCN WMS",
-        sampled_at="2026-02-05",
-    )
-    mock_climate.return_value = ClimateStressRiskCard(
-        level=RiskLevel.high,
-        heat_level=RiskLevel.high,
-        water_level=RiskLevel.medium,
-        source="Klimaateffectatlas WMS/WFS",
-        sampled_at="2026-02-05",
-    )
+async def test_get_risk_cards_assembly(
+    risk_mocks, sample_noise_card, sample_air_card, sample_climate_card
+):
+    risk_mocks.noise_card.return_value = sample_noise_card
+    risk_mocks.air_card.return_value = sample_air_card
+    risk_mocks.climate_card.return_value = sample_climate_card
 
-    resp = await get_risk_cards(
-        vbo_id="0363010000696734",
-        rd_x=121286.0,
-        rd_y=487296.0,
-        lat=52.372,
-        lng=4.892,
-    )
+    resp = await get_risk_cards(**_VBO_KWARGS)
 
     assert resp.address_id == "0363010000696734"
-    assert resp.noise.level == RiskLevel.low
-    assert resp.air_quality.level == RiskLevel.medium
-    assert resp.climate_stress.level == RiskLevel.high
+    assert resp.noise.level == LOW
+    assert resp.air_quality.level == MEDIUM
+    assert resp.climate_stress.level == HIGH
+
+
+async def test_get_risk_cards_builds_cards_concurrently(
+    risk_mocks, sample_noise_card, sample_air_card, sample_climate_card
+):
+    """All three card builders are in flight before any of them completes."""
+    started = []
+    all_started = asyncio.Event()
+
+    def builder(card):
+        async def build(*args):
+            started.append(card)
+            if len(started) == 3:
+                all_started.set()
+            # Sequential awaits would block here until the timeout fires.
+            await asyncio.wait_for(all_started.wait(), timeout=1.0)
+            return card
+
+        return build
+
+    risk_mocks.noise_card.side_effect = builder(sample_noise_card)
+    risk_mocks.air_card.side_effect = builder(sample_air_card)
+    risk_mocks.climate_card.side_effect = builder(sample_climate_card)
+
+    resp = await get_risk_cards(**_VBO_KWARGS)
+
+    assert len(started) == 3
+    assert resp.climate_stress.level == HIGH
 
 
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._sample_climate_layer", new_callable=AsyncMock)
-@patch("app.services.risk_cards._get_climate_layer_names", new_callable=AsyncMock)
-async def test_climate_card_selects_worst_case_heat(mock_layers, mock_sample):
+async def test_climate_card_selects_worst_case_heat(risk_mocks):
     """When multiple heat layers return data, the worst-case (highest risk) wins."""
     heat_names = [layer for layer, _ in _CLIMATE_HEAT_LAYERS]
     # Only heat layers available — no water layers
-    mock_layers.return_value = set(heat_names)
+    risk_mocks.climate_layers.return_value = set(heat_names)
 
     # Layer 0 (national raster): GRAY_INDEX 0.5 → low (threshold: ≤0.65)
     # Layer 1 (regional vector): text "Hoge urgentie" → high
@@ -158,28 +214,22 @@ async def test_climate_card_selects_worst_case_heat(mock_layers, mock_sample):
         heat_names[1]: {"urgentie": "Hoge urgentie"},
     }
 
-    async def side_effect(layer, layer_type, rd_x, rd_y):
-        return results.get(layer)
-
-    mock_sample.side_effect = side_effect
+    risk_mocks.climate_sample.side_effect = lambda layer, layer_type, rd_x, rd_y: results.get(layer)
 
     card = await _build_climate_card(121000.0, 487000.0, "2026-02-05")
 
     # Must pick high (from layer 1), not low (from layer 0 which is iterated first)
-    assert card.heat_level == RiskLevel.high
+    assert card.heat_level == HIGH
     assert card.heat_layer == heat_names[1]
     # Water has no available layers, so should be unavailable
-    assert card.water_level == RiskLevel.unavailable
+    assert card.water_level == UNAVAIL
 
 
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._sample_climate_layer", new_callable=AsyncMock)
-@patch("app.services.risk_cards._get_climate_layer_names", new_callable=AsyncMock)
-async def test_climate_card_selects_worst_case_water(mock_layers, mock_sample):
+async def test_climate_card_selects_worst_case_water(risk_mocks):
     """When multiple water layers return data, the worst-case (highest risk) wins."""
     water_names = [layer for layer, _ in _CLIMATE_WATER_LAYERS]
     # Only water layers available — no heat layers
-    mock_layers.return_value = set(water_names)
+    risk_mocks.climate_layers.return_value = set(water_names)
 
     # Layer 0: Begaanbaar text → low
     # Layer 3: Onbegaanbaar text → high
@@ -188,53 +238,22 @@ async def test_climate_card_selects_worst_case_water(mock_layers, mock_sample):
         water_names[3]: {"Begaanbaar": "Onbegaanbaar"},
     }
 
-    async def side_effect(layer, layer_type, rd_x, rd_y):
-        return results.get(layer)
-
-    mock_sample.side_effect = side_effect
+    risk_mocks.climate_sample.side_effect = lambda layer, layer_type, rd_x, rd_y: results.get(layer)
 
     card = await _build_climate_card(121000.0, 487000.0, "2026-02-05")
 
     # Must pick high (from layer 3), not low (from layer 0 which is iterated first)
-    assert card.water_level == RiskLevel.high
+    assert card.water_level == HIGH
     assert card.water_layer == water_names[3]
     # Heat has no available layers, so should be unavailable
-    assert card.heat_level == RiskLevel.unavailable
-
+    assert card.heat_level == UNAVAIL
 
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._get_client")
-async def test_wfs_bbox_uses_narrow_range(mock_get_client):
-    """WFS bbox should be ±5m (10m square), not ±300m."""
-    from unittest.mock import MagicMock
-
-    mock_response = MagicMock()
-    mock_response.raise_for_status = MagicMock()
-    mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {
-        "features": [{"properties": {"value": 42}, "geometry": {"type": "Point"}}]
-    }
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_get_client.return_value = mock_client
-
-    await _sample_wfs_properties("test:layer", 121000.0, 487000.0)
-
-    call_kwargs = mock_client.get.call_args
-    bbox_param = call_kwargs.kwargs.get("params", call_kwargs[1].get("params", {})).get("bbox")
-    assert bbox_param == "120995.0,486995.0,121005.0,487005.0,EPSG:28992"
 
-
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._get_client")
-async def test_wfs_picks_closest_feature(mock_get_client):
-    """When multiple features returned, pick the one closest to query point."""
-    from unittest.mock import MagicMock
-
-    mock_response = MagicMock()
-    mock_response.raise_for_status = MagicMock()
-    mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {
+_POINT_JSON = orjson.dumps(
+    {"features": [{"properties": {"value": 42}, "geometry": {"type": "Point"}}]}
+)
+_CLOSE_FAR_JSON = orjson.dumps(
+    {
         "features": [
             {
                 "properties": {"value": "far"},
@@ -248,25 +267,9 @@ async def test_wfs_picks_closest_feature(mock_get_client):
             },
         ]
     }
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_get_client.return_value = mock_client
-
-    result = await _sample_wfs_properties("test:layer", 121000.0, 487000.0)
-    assert result is not None
-    assert result["value"] == "close"
-
-
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._get_client")
-async def test_wfs_prefers_containing_polygon(mock_get_client):
-    """If a polygon contains the point, prefer it even if another centroid is closer."""
-    from unittest.mock import MagicMock
-
-    mock_response = MagicMock()
-    mock_response.raise_for_status = MagicMock()
-    mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {
+)
+_CONTAIN_JSON = orjson.dumps(
+    {
         "features": [
             {
                 "properties": {"value": "contains"},
@@ -302,22 +305,50 @@ async def test_wfs_prefers_containing_polygon(mock_get_client):
             },
         ]
     }
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_get_client.return_value = mock_client
+)
+
+
+async def test_wfs_bbox_uses_narrow_range(monkeypatch, wfs_response_factory):
+    """WFS bbox should be ±5m (10m square), not ±300m."""
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=wfs_response_factory(orjson.loads(_POINT_JSON)))
+    monkeypatch.setattr(rc, "_get_client", lambda: mock_client)
+
+    await _sample_wfs_properties("test:layer", 121000.0, 487000.0)
+
+    call_kwargs = mock_client.get.call_args
+    bbox_param = call_kwargs.kwargs.get("params", call_kwargs[1].get("params", {})).get("bbox")
+    *coords, crs = bbox_param.split(",")
+    assert tuple(map(float, coords)) == (120995.0, 486995.0, 121005.0, 487005.0)
+    assert crs == "EPSG:28992"
+
+
+async def test_wfs_picks_closest_feature(monkeypatch, wfs_response_factory):
+    """When multiple features returned, pick the one closest to query point."""
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=wfs_response_factory(orjson.loads(_CLOSE_FAR_JSON)))
+    monkeypatch.setattr(rc, "_get_client", lambda: mock_client)
+
+    result = await _sample_wfs_properties("test:layer", 121000.0, 487000.0)
+    assert result is not None
+    assert result["value"] == "close"
+
+
+async def test_wfs_prefers_containing_polygon(monkeypatch, wfs_response_factory):
+    """If a polygon contains the point, prefer it even if another centroid is closer."""
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=wfs_response_factory(orjson.loads(_CONTAIN_JSON)))
+    monkeypatch.setattr(rc, "_get_client", lambda: mock_client)
 
     result = await _sample_wfs_properties("test:layer", 121000.0, 487000.0)
     assert result is not None
     assert result["value"] == "contains"
 
 
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._sample_climate_layer", new_callable=AsyncMock)
-@patch("app.services.risk_cards._get_climate_layer_names", new_callable=AsyncMock)
-async def test_climate_source_date_none_when_no_layer_date(mock_layers, mock_sample):
+async def test_climate_source_date_none_when_no_layer_date(risk_mocks):
     """source_date should be None (not sampled_at) when layer names have no dates."""
     # Use layers with no date info in names
-    mock_layers.return_value = {"test:no_date_layer"}
+    risk_mocks.climate_layers.return_value = {"test:no_date_layer"}
 
     # No heat/water layers from the predefined lists are available
     card = await _build_climate_card(121000.0, 487000.0, "2026-02-05")
@@ -333,66 +364,38 @@ def test_extract_layer_date_returns_none_for_undated_names():
     assert _extract_layer_date(None) is None
 
 
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._sample_wms_properties", new_callable=AsyncMock)
-@patch("app.services.risk_cards._get_gcn_layers", new_callable=AsyncMock)
-async def test_build_air_card_filters_sentinel_values(mock_layers, mock_sample):
+@pytest.mark.parametrize(
+    "samples",
+    [
+        # Sentinels under the layer's own key (-999 and 1e30)
+        {"conc_PM25_2024": {"conc_PM25_2024": -999}, "conc_NO2_2024": {"conc_NO2_2024": 1e30}},
+        # Sentinels from a non-layer key
+        {"conc_PM25_2024": {"GRAY_INDEX": -999}, "conc_NO2_2024": {"GRAY_INDEX": -999}},
+    ],
+    ids=["layer_key", "alt_key"],
+)
+async def test_build_air_card_filters_sentinel(risk_mocks, samples):
     """Sentinel values (-999, -9999, 1e30) must produce unavailable, not low."""
-    mock_layers.return_value = ["conc_PM25_2024", "conc_NO2_2024"]
+    risk_mocks.gcn_layers.return_value = ["conc_PM25_2024", "conc_NO2_2024"]
 
-    # PM2.5 returns sentinel -999, NO2 returns sentinel 1e30
-    async def side_effect(base_url, layer, rd_x, rd_y):
-        if "PM25" in layer:
-            return {layer: -999}
-        if "NO2" in layer:
-            return {layer: 1e30}
-        return None
-
-    mock_sample.side_effect = side_effect
+    risk_mocks.wms_sample.side_effect = lambda base_url, layer, rd_x, rd_y: samples.get(layer)
 
     card = await _build_air_card(121000.0, 487000.0, "2026-02-05")
 
-    assert card.pm25_level == RiskLevel.unavailable
+    assert card.pm25_level == UNAVAIL
     assert card.pm25_ug_m3 is None
-    assert card.no2_level == RiskLevel.unavailable
+    assert card.no2_level == UNAVAIL
     assert card.no2_ug_m3 is None
-    assert card.level == RiskLevel.unavailable
-
-
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._sample_wms_properties", new_callable=AsyncMock)
-@patch("app.services.risk_cards._get_gcn_layers", new_callable=AsyncMock)
-async def test_build_air_card_filters_sentinel_from_alt_key(mock_layers, mock_sample):
-    """Sentinel values from non-layer keys should be ignored."""
-    mock_layers.return_value = ["conc_PM25_2024", "conc_NO2_2024"]
+    assert card.level == UNAVAIL
 
-    async def side_effect(base_url, layer, rd_x, rd_y):
-        return {"GRAY_INDEX": -999}
-
-    mock_sample.side_effect = side_effect
-
-    card = await _build_air_card(121000.0, 487000.0, "2026-02-05")
 
-    assert card.pm25_level == RiskLevel.unavailable
-    assert card.pm25_ug_m3 is None
-    assert card.no2_level == RiskLevel.unavailable
-    assert card.no2_ug_m3 is None
-    assert card.level == RiskLevel.unavailable
-
-
-@pytest.mark.asyncio
-@patch("app.services.risk_cards._sample_wms_properties", new_callable=AsyncMock)
-@patch("app.services.risk_cards._get_alo_layers", new_callable=AsyncMock)
-async def test_build_noise_card_filters_sentinel(mock_layers, mock_sample):
+async def test_build_noise_card_filters_sentinel(risk_mocks):
     """Noise sentinel values should produce unavailable."""
-    mock_layers.return_value = ["rivm_20250101_Geluid_lden_wegverkeer_2022"]
-
-    async def side_effect(base_url, layer, rd_x, rd_y):
-        return {"GRAY_INDEX": -999}
+    risk_mocks.alo_layers.return_value = ["rivm_20250101_Geluid_lden_wegverkeer_2022"]
 
-    mock_sample.side_effect = side_effect
+    risk_mocks.wms_sample.return_value = {"GRAY_INDEX": -999}
 
     card = await _build_noise_card(121000.0, 487000.0, "2026-02-05")
 
-    assert card.level == RiskLevel.unavailable
+    assert card.level == UNAVAIL
     assert card.lden_db is None
@@ -24,7 +24,6 @@ ROTTERDAM_RD_X = 92500.0
 ROTTERDAM_RD_Y = 437500.0
 
 
-@pytest.mark.asyncio
 async def test_alo_layers_include_noise():
     layers = await _get_alo_layers()
     noise_layers = [
@@ -34,7 +33,6 @@ async def test_alo_layers_include_noise():
     assert len(noise_layers) >= 1
 
 
-@pytest.mark.asyncio
 async def test_noise_card_amsterdam():
     card = await _build_noise_card(AMSTERDAM_RD_X, AMSTERDAM_RD_Y, _utc_now_iso_date())
     assert card.level != RiskLevel.unavailable, card.message
@@ -42,14 +40,12 @@ async def test_noise_card_amsterdam():
     assert 30 <= card.lden_db <= 90
 
 
-@pytest.mark.asyncio
 async def test_air_card_amsterdam():
     card = await _build_air_card(AMSTERDAM_RD_X, AMSTERDAM_RD_Y, _utc_now_iso_date())
     assert card.level != RiskLevel.unavailable, card.message
     assert card.pm25_ug_m3 is not None or card.no2_ug_m3 is not None
 
 
-@pytest.mark.asyncio
 async def test_climate_card_amsterdam():
     card = await _build_climate_card(AMSTERDAM_RD_X, AMSTERDAM_RD_Y, _utc_now_iso_date())
     assert (
@@ -58,7 +54,6 @@ async def test_climate_card_amsterdam():
     ), card.message
 
 
-@pytest.mark.asyncio
 async def test_noise_card_rotterdam():
     card = await _build_noise_card(ROTTERDAM_RD_X, ROTTERDAM_RD_Y, _utc_now_iso_date())
     assert card.level != RiskLevel.unavailable, card.message
@@ -1,21 +1,57 @@
+import asyncio
+import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import numpy as np
+import orjson
 import pytest
 
+import app.services.three_d_bag as three_d_bag_module
 from app.models.neighborhood3d import BuildingBlock
 from app.services.three_d_bag import (
     MAX_PAGES,
+    PAGE_SIZE,
+    _cached_bbox_buildings,
     _fetch_bbox_buildings,
     _fetch_target_building,
+    _footprint_offsets,
     _parse_building,
     get_neighborhood_3d,
 )
 
+
+@pytest.fixture(autouse=True)
+def bbox_cache(monkeypatch):
+    """Isolate the bbox caches: empty in-process LRU, Redis replaced by mocks."""
+    redis = SimpleNamespace(get=AsyncMock(return_value=None), set=AsyncMock())
+    monkeypatch.setattr(three_d_bag_module, "cache_get", redis.get)
+    monkeypatch.setattr(three_d_bag_module, "cache_set", redis.set)
+    three_d_bag_module._bbox_cache.clear()
+    three_d_bag_module._bbox_inflight.clear()
+    yield redis
+    three_d_bag_module._bbox_cache.clear()
+    three_d_bag_module._bbox_inflight.clear()
+
+
 # --- _parse_building unit tests ---
 
+# Shared, never-mutated building parts: the factories below reference these
+# rather than rebuilding identical vertex and geometry lists on every call.
+_SQUARE_VERTICES = [
+    [0, 0, 0],
+    [10000, 0, 0],
+    [10000, 10000, 0],
+    [0, 10000, 0],
+]
+_LOD0_SQUARE = [{"lod": "0", "type": "MultiSurface", "boundaries": [[[0, 1, 2, 3]]]}]
+_LOD22_SOLID = {"lod": "2.2", "type": "Solid", "boundaries": []}
+
 SCALE = [0.001, 0.001, 0.001]
 TRANSLATE = [121000.0, 487000.0, 0.0]
+# Shared by identity across every mocked response; never mutated
+_METADATA = {"transform": {"scale": SCALE, "translate": TRANSLATE}}
 CENTER_X = 121005.0
 CENTER_Y = 487005.0
 
@@ -33,10 +69,11 @@ def _make_city_object(
     if lod0:
         if boundaries is None:
             # Square footprint: 10m x 10m centered at translate origin
-            boundaries = [[[0, 1, 2, 3]]]
-        geoms.append({"lod": "0", "type": "MultiSurface", "boundaries": boundaries})
+            geoms.extend(_LOD0_SQUARE)
+        else:
+            geoms.append({"lod": "0", "type": "MultiSurface", "boundaries": boundaries})
     # Always include a higher LoD too
-    geoms.append({"lod": "2.2", "type": "Solid", "boundaries": []})
+    geoms.append(_LOD22_SOLID)
 
     attrs = {"identificatie": "NL.IMBAG.Pand.0363100012253924", "oorspronkelijkbouwjaar": year}
     if h_maaiveld is not None:
@@ -69,8 +106,19 @@ def test_parse_building():
     assert result.building_height == 16.43
     assert result.year == 1917
     assert len(result.footprint) == 4
-    assert result.footprint[0] == [-5.0, -5.0]
-    assert result.footprint[1] == [5.0, -5.0]
+    assert result.footprint[0] == (-5.0, -5.0)
+    assert result.footprint[1] == (5.0, -5.0)
+
+
+def test_parse_building_matches_validated_model():
+    """The unvalidated fast path yields the same model Pydantic would build."""
+    attrs, geoms = _make_city_object(h_maaiveld=2, h_dak_max=12)
+    city_object = {"type": "Building", "attributes": attrs, "geometry": geoms}
+
+    result = _parse_building(city_object, _SQUARE_VERTICES, SCALE, TRANSLATE, CENTER_X, CENTER_Y)
+
+    assert result == BuildingBlock.model_validate(result.model_dump())
+    assert isinstance(result.ground_height, float)
 
 
 def test_parse_building_missing_heights():
@@ -120,6 +168,41 @@ def test_parse_building_too_few_vertices():
     assert result is None
 
 
+def test_footprint_offsets_matches_vectorized_path(monkeypatch):
+    # The numba kernel source must agree with the NumPy fallback.
+    attrs, geoms = _make_city_object(boundaries=[[[3, 1, 0, 2]]])
+    city_object = {"type": "Building", "attributes": attrs, "geometry": geoms}
+    vertices = np.array(_SQUARE_VERTICES, dtype=np.int64)
+    idx = np.array([3, 1, 0, 2], dtype=np.intp)
+    ox, oy = TRANSLATE[0] - CENTER_X, TRANSLATE[1] - CENTER_Y
+    kernel = _footprint_offsets(vertices, idx, SCALE[0], SCALE[1], ox, oy)
+
+    monkeypatch.setattr(three_d_bag_module, "_footprint_offsets_jit", None)
+    result = _parse_building(city_object, vertices, SCALE, TRANSLATE, CENTER_X, CENTER_Y)
+
+    assert result.footprint == list(map(tuple, kernel.round(2).tolist()))
+
+
+def test_parse_building_int32_vertices_take_jit_path(monkeypatch):
+    attrs, geoms = _make_city_object()
+    city_object = {"type": "Building", "attributes": attrs, "geometry": geoms}
+    kernel = MagicMock(side_effect=_footprint_offsets)
+    monkeypatch.setattr(three_d_bag_module, "_footprint_offsets_jit", kernel)
+
+    result = _parse_building(
+        city_object,
+        np.array(_SQUARE_VERTICES, dtype=np.int32),
+        SCALE,
+        TRANSLATE,
+        CENTER_X,
+        CENTER_Y,
+    )
+
+    kernel.assert_called_once()
+    assert kernel.call_args.args[0].dtype == np.int64
+    assert result.footprint[0] == (-5.0, -5.0)
+
+
 # --- Helper factories ---
 
 
@@ -131,47 +214,33 @@ def _make_3dbag_response(features, next_link=None):
     return {
         "type": "FeatureCollection",
         "features": features,
-        "metadata": {
-            "transform": {
-                "scale": [0.001, 0.001, 0.001],
-                "translate": [121000.0, 487000.0, 0.0],
-            }
-        },
+        "metadata": _METADATA,
         "links": links,
         "numberMatched": len(features),
         "numberReturned": len(features),
     }
 
 
+def _building_object(co_name, h_maaiveld, h_dak_max, year):
+    return {
+        "type": "Building",
+        "attributes": {
+            "identificatie": co_name,
+            "b3_h_maaiveld": h_maaiveld,
+            "b3_h_dak_max": h_dak_max,
+            "oorspronkelijkbouwjaar": year,
+        },
+        "geometry": _LOD0_SQUARE,
+    }
+
+
 def _make_feature(pand_id="0363100012253924", h_maaiveld=1.75, h_dak_max=18.18, year=1917):
     co_name = f"NL.IMBAG.Pand.{pand_id}"
     return {
         "type": "CityJSONFeature",
         "id": co_name,
-        "CityObjects": {
-            co_name: {
-                "type": "Building",
-                "attributes": {
-                    "identificatie": f"NL.IMBAG.Pand.{pand_id}",
-                    "b3_h_maaiveld": h_maaiveld,
-                    "b3_h_dak_max": h_dak_max,
-                    "oorspronkelijkbouwjaar": year,
-                },
-                "geometry": [
-                    {
-                        "lod": "0",
-                        "type": "MultiSurface",
-                        "boundaries": [[[0, 1, 2, 3]]],
-                    }
-                ],
-            }
-        },
-        "vertices": [
-            [0, 0, 0],
-            [10000, 0, 0],
-            [10000, 10000, 0],
-            [0, 10000, 0],
-        ],
+        "CityObjects": {co_name: _building_object(co_name, h_maaiveld, h_dak_max, year)},
+        "vertices": _SQUARE_VERTICES,
     }
 
 
@@ -185,75 +254,96 @@ def _make_single_item_response(
     - metadata.transform: transform at ROOT level (NOT inside feature!)
     """
     co_name = f"NL.IMBAG.Pand.{pand_id}"
-    vertices = [
-        [0, 0, 0],
-        [10000, 0, 0],
-        [10000, 10000, 0],
-        [0, 10000, 0],
-    ]
     return {
         "type": "CityJSONFeature",
         "id": co_name,
         "feature": {
-            "CityObjects": {
-                co_name: {
-                    "type": "Building",
-                    "attributes": {
-                        "identificatie": co_name,
-                        "b3_h_maaiveld": h_maaiveld,
-                        "b3_h_dak_max": h_dak_max,
-                        "oorspronkelijkbouwjaar": year,
-                    },
-                    "geometry": [
-                        {
-                            "lod": "0",
-                            "type": "MultiSurface",
-                            "boundaries": [[[0, 1, 2, 3]]],
-                        }
-                    ],
-                }
-            },
-            "vertices": vertices,
+            "CityObjects": {co_name: _building_object(co_name, h_maaiveld, h_dak_max, year)},
+            "vertices": _SQUARE_VERTICES,
             # Note: NO metadata inside feature (matches real API)
         },
         # Transform is at ROOT level metadata
-        "metadata": {
-            "transform": {
-                "scale": [0.001, 0.001, 0.001],
-                "translate": [121000.0, 487000.0, 0.0],
-            }
-        },
+        "metadata": _METADATA,
     }
 
 
-def _make_mock_resp(data):
-    """Create a MagicMock HTTP response with the given JSON data."""
-    resp = MagicMock()
-    resp.json.return_value = data
-    resp.raise_for_status.return_value = None
-    return resp
+_JSON_HEADERS = {"content-type": "application/json"}
+_SINGLE_ITEM_PATH = "/collections/pand/items/NL.IMBAG.Pand."
 
 
-def _route_responses(direct_resp, bbox_resp):
-    """Create a side_effect function that routes by URL pattern."""
-    def _side_effect(url, **kwargs):
-        if "NL.IMBAG.Pand." in str(url):
-            return direct_resp
-        return bbox_resp
-    return _side_effect
+def _is_single_item(url: httpx.URL) -> bool:
+    return url.path.startswith(_SINGLE_ITEM_PATH)
 
 
-# --- _fetch_target_building tests ---
+def _json_response(data):
+    return httpx.Response(200, content=orjson.dumps(data), headers=_JSON_HEADERS)
+
+
+@pytest.fixture
+async def bag_routes(monkeypatch):
+    """Install a MockTransport client that routes single-item vs bbox requests.
+
+    Tests set ``direct`` and ``bbox`` to a JSON payload dict, an HTTP status code,
+    or a callable taking the ``httpx.Request``; every request is recorded.
+    """
+    routes = SimpleNamespace(direct=404, bbox=_make_3dbag_response([]), requests=[])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        routes.requests.append(request)
+        route = routes.direct if _is_single_item(request.url) else routes.bbox
+        if callable(route):
+            return route(request)
+        if isinstance(route, int):
+            return httpx.Response(route)
+        return _json_response(route)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(three_d_bag_module, "_client", client)
+    yield routes
+    await client.aclose()
+
 
+def _paged(make_page):
+    """Route callable that serves ``make_page(n)`` for the n-th bbox request."""
+    count = 0
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_fetch_target_building_success(mock_get_client):
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
+    def route(request):
+        nonlocal count
+        count += 1
+        return _json_response(make_page(count))
 
-    data = _make_single_item_response()
-    mock_client.get.return_value = _make_mock_resp(data)
+    return route
+
+
+def _endless_page(n):
+    return _make_3dbag_response(
+        [_make_feature(f"036310000000{n:04d}")],
+        next_link=f"https://api.3dbag.nl/collections/pand/items?offset={n}",
+    )
+
+
+_BATCHED_LIMIT = str((MAX_PAGES - 1) * PAGE_SIZE)
+
+
+def _reject_batched(route):
+    """Wrap a bbox route so the batched remaining-pages request gets a 400."""
+    def reject(request):
+        if request.url.params.get("limit") == _BATCHED_LIMIT:
+            return httpx.Response(400)
+        return route(request)
+
+    return reject
+
+
+def _bbox_requests(routes):
+    return [r for r in routes.requests if not _is_single_item(r.url)]
+
+
+# --- _fetch_target_building tests ---
+
+
+async def test_fetch_target_building_success(bag_routes):
+    bag_routes.direct = _make_single_item_response()
 
     result = await _fetch_target_building("0363100012253924", CENTER_X, CENTER_Y)
 
@@ -261,19 +351,11 @@ async def test_fetch_target_building_success(mock_get_client):
     assert result.pand_id == "0363100012253924"
     assert result.building_height == 16.43
     # Verify correct URL was called
-    call_url = str(mock_client.get.call_args[0][0])
-    assert "NL.IMBAG.Pand.0363100012253924" in call_url
+    assert bag_routes.requests[0].url.path == _SINGLE_ITEM_PATH + "0363100012253924"
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_fetch_target_building_http_error(mock_get_client):
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
-    mock_client.get.side_effect = httpx.HTTPStatusError(
-        "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
-    )
+async def test_fetch_target_building_http_error(bag_routes):
+    bag_routes.direct = 404
 
     result = await _fetch_target_building("0363100012253924", CENTER_X, CENTER_Y)
     assert result is None
@@ -282,18 +364,9 @@ async def test_fetch_target_building_http_error(mock_get_client):
 # --- get_neighborhood_3d integration tests (mocked HTTP) ---
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_get_neighborhood_3d_single_page(mock_get_client):
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
-    direct_data = _make_single_item_response()
-    bbox_data = _make_3dbag_response([_make_feature()])
-
-    mock_client.get.side_effect = _route_responses(
-        _make_mock_resp(direct_data), _make_mock_resp(bbox_data)
-    )
+async def test_get_neighborhood_3d_single_page(bag_routes):
+    bag_routes.direct = _make_single_item_response()
+    bag_routes.bbox = _make_3dbag_response([_make_feature()])
 
     result = await get_neighborhood_3d(
         pand_id="0363100012253924",
@@ -310,30 +383,15 @@ async def test_get_neighborhood_3d_single_page(mock_get_client):
     assert result.message is None
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_get_neighborhood_3d_pagination(mock_get_client):
-    """MAX_PAGES limits bbox fetches even if more next_links exist."""
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
-    direct_data = _make_single_item_response()
-
-    # Each page has a next_link; mock returns same page repeatedly
-    page1 = _make_3dbag_response(
+async def test_get_neighborhood_3d_single_batched_bbox_request(bag_routes):
+    """After the first page, one batched request replaces the remaining round trips."""
+    bag_routes.direct = _make_single_item_response()
+    # Every page has a next_link; it is not followed after the batched request
+    bag_routes.bbox = _make_3dbag_response(
         [_make_feature("0363100012253924"), _make_feature("0363100099999999", year=2000)],
         next_link="https://api.3dbag.nl/collections/pand/items?offset=1",
     )
 
-    bbox_resp1 = _make_mock_resp(page1)
-
-    def route(url, **kwargs):
-        if "NL.IMBAG.Pand." in str(url):
-            return _make_mock_resp(direct_data)
-        return bbox_resp1
-
-    mock_client.get.side_effect = route
-
     result = await get_neighborhood_3d(
         pand_id="0363100012253924",
         rd_x=121005.0,
@@ -342,33 +400,19 @@ async def test_get_neighborhood_3d_pagination(mock_get_client):
         lng=4.892,
     )
 
-    # Target (direct) + 1 neighbor from page1 (target in page1 deduplicated)
+    # Target (direct) + 1 neighbor from the bbox (target and repeats deduplicated)
     assert len(result.buildings) == 2
     assert result.target_pand_id == "0363100012253924"
 
-    # Verify fetches respect MAX_PAGES: direct + MAX_PAGES bbox calls
-    bbox_calls = [c for c in mock_client.get.call_args_list if "NL.IMBAG.Pand." not in str(c)]
-    assert len(bbox_calls) == MAX_PAGES, f"Expected {MAX_PAGES} bbox calls, got {len(bbox_calls)}"
-
+    bbox_calls = _bbox_requests(bag_routes)
+    assert [c.url.params["limit"] for c in bbox_calls] == [str(PAGE_SIZE), _BATCHED_LIMIT]
+    assert bbox_calls[1].url.params["offset"] == "1"
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_get_neighborhood_3d_empty(mock_get_client):
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
 
+async def test_get_neighborhood_3d_empty(bag_routes):
     # Direct fetch fails, bbox returns empty
-    direct_error = httpx.HTTPStatusError(
-        "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
-    )
-    bbox_data = _make_3dbag_response([])
-
-    def route(url, **kwargs):
-        if "NL.IMBAG.Pand." in str(url):
-            raise direct_error
-        return _make_mock_resp(bbox_data)
-
-    mock_client.get.side_effect = route
+    bag_routes.direct = 404
+    bag_routes.bbox = _make_3dbag_response([])
 
     result = await get_neighborhood_3d(
         pand_id="0363100012253924",
@@ -383,24 +427,10 @@ async def test_get_neighborhood_3d_empty(mock_get_client):
     assert result.message == "No 3D building data available for this area"
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_get_neighborhood_3d_target_not_found(mock_get_client):
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
+async def test_get_neighborhood_3d_target_not_found(bag_routes):
     # Direct fetch fails, bbox has other buildings
-    direct_error = httpx.HTTPStatusError(
-        "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
-    )
-    bbox_data = _make_3dbag_response([_make_feature("0363100099999999")])
-
-    def route(url, **kwargs):
-        if "NL.IMBAG.Pand." in str(url):
-            raise direct_error
-        return _make_mock_resp(bbox_data)
-
-    mock_client.get.side_effect = route
+    bag_routes.direct = 404
+    bag_routes.bbox = _make_3dbag_response([_make_feature("0363100099999999")])
 
     result = await get_neighborhood_3d(
         pand_id="0363100012253924",
@@ -418,20 +448,11 @@ async def test_get_neighborhood_3d_target_not_found(mock_get_client):
 # --- New tests for direct fetch + parallel strategy ---
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_get_neighborhood_3d_target_via_direct(mock_get_client):
+async def test_get_neighborhood_3d_target_via_direct(bag_routes):
     """Target found via direct fetch even when bbox doesn't contain it."""
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
-    direct_data = _make_single_item_response("0363100012253924")
+    bag_routes.direct = _make_single_item_response("0363100012253924")
     # Bbox only has a different building
-    bbox_data = _make_3dbag_response([_make_feature("0363100099999999")])
-
-    mock_client.get.side_effect = _route_responses(
-        _make_mock_resp(direct_data), _make_mock_resp(bbox_data)
-    )
+    bag_routes.bbox = _make_3dbag_response([_make_feature("0363100099999999")])
 
     result = await get_neighborhood_3d(
         pand_id="0363100012253924",
@@ -448,25 +469,16 @@ async def test_get_neighborhood_3d_target_via_direct(mock_get_client):
     assert result.buildings[0].pand_id == "0363100012253924"  # target first
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_get_neighborhood_3d_deduplication(mock_get_client):
+async def test_get_neighborhood_3d_deduplication(bag_routes):
     """Target in both direct + bbox appears only once."""
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
     pand_id = "0363100012253924"
-    direct_data = _make_single_item_response(pand_id)
+    bag_routes.direct = _make_single_item_response(pand_id)
     # Bbox also has the same target + another building
-    bbox_data = _make_3dbag_response([
+    bag_routes.bbox = _make_3dbag_response([
         _make_feature(pand_id),
         _make_feature("0363100099999999"),
     ])
 
-    mock_client.get.side_effect = _route_responses(
-        _make_mock_resp(direct_data), _make_mock_resp(bbox_data)
-    )
-
     result = await get_neighborhood_3d(
         pand_id=pand_id,
         rd_x=121005.0,
@@ -482,19 +494,9 @@ async def test_get_neighborhood_3d_deduplication(mock_get_client):
     assert result.buildings[0].pand_id == pand_id  # target is first
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_get_neighborhood_3d_vbo_id_as_address_id(mock_get_client):
+async def test_get_neighborhood_3d_vbo_id_as_address_id(bag_routes):
     """address_id uses vbo_id when provided."""
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
-    direct_data = _make_single_item_response()
-    bbox_data = _make_3dbag_response([])
-
-    mock_client.get.side_effect = _route_responses(
-        _make_mock_resp(direct_data), _make_mock_resp(bbox_data)
-    )
+    bag_routes.direct = _make_single_item_response()
 
     result = await get_neighborhood_3d(
         pand_id="0363100012253924",
@@ -508,19 +510,9 @@ async def test_get_neighborhood_3d_vbo_id_as_address_id(mock_get_client):
     assert result.address_id == "0363010012345678"
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_get_neighborhood_3d_address_id_fallback_to_pand_id(mock_get_client):
+async def test_get_neighborhood_3d_address_id_fallback_to_pand_id(bag_routes):
     """address_id falls back to pand_id when vbo_id not provided."""
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
-    direct_data = _make_single_item_response()
-    bbox_data = _make_3dbag_response([])
-
-    mock_client.get.side_effect = _route_responses(
-        _make_mock_resp(direct_data), _make_mock_resp(bbox_data)
-    )
+    bag_routes.direct = _make_single_item_response()
 
     result = await get_neighborhood_3d(
         pand_id="0363100012253924",
@@ -533,53 +525,47 @@ async def test_get_neighborhood_3d_address_id_fallback_to_pand_id(mock_get_clien
     assert result.address_id == "0363100012253924"
 
 
+async def test_get_neighborhood_3d_fetches_concurrently(monkeypatch):
+    """Direct and bbox fetches are both in flight before either completes."""
+    started = []
+    both_started = asyncio.Event()
+
+    async def fetch(name, result):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        # A sequential implementation would block here until the timeout fires.
+        await asyncio.wait_for(both_started.wait(), timeout=1.0)
+        return result
+
+    monkeypatch.setattr(
+        three_d_bag_module, "_fetch_target_building", lambda *args: fetch("direct", None)
+    )
+    monkeypatch.setattr(
+        three_d_bag_module, "_cached_bbox_buildings", lambda *args: fetch("bbox", [])
+    )
+
+    await get_neighborhood_3d(
+        pand_id="0363100012253924", rd_x=121005.0, rd_y=487005.0, lat=52.372, lng=4.892,
+    )
+
+    assert sorted(started) == ["bbox", "direct"]
+
+
 # --- Bug fix tests ---
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_fetch_target_building_root_level_fallback(mock_get_client):
+async def test_fetch_target_building_root_level_fallback(bag_routes):
     """Old-style response without 'feature' wrapper still works via fallback."""
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
     co_name = "NL.IMBAG.Pand.0363100012253924"
     # Root-level structure (no "feature" key) — legacy/fallback shape
-    data = {
+    bag_routes.direct = {
         "type": "CityJSONFeature",
         "id": co_name,
-        "CityObjects": {
-            co_name: {
-                "type": "Building",
-                "attributes": {
-                    "identificatie": co_name,
-                    "b3_h_maaiveld": 1.75,
-                    "b3_h_dak_max": 18.18,
-                    "oorspronkelijkbouwjaar": 1917,
-                },
-                "geometry": [
-                    {
-                        "lod": "0",
-                        "type": "MultiSurface",
-                        "boundaries": [[[0, 1, 2, 3]]],
-                    }
-                ],
-            }
-        },
-        "vertices": [
-            [0, 0, 0],
-            [10000, 0, 0],
-            [10000, 10000, 0],
-            [0, 10000, 0],
-        ],
-        "metadata": {
-            "transform": {
-                "scale": [0.001, 0.001, 0.001],
-                "translate": [121000.0, 487000.0, 0.0],
-            }
-        },
+        "CityObjects": {co_name: _building_object(co_name, 1.75, 18.18, 1917)},
+        "vertices": _SQUARE_VERTICES,
+        "metadata": _METADATA,
     }
-    mock_client.get.return_value = _make_mock_resp(data)
 
     result = await _fetch_target_building("0363100012253924", CENTER_X, CENTER_Y)
 
@@ -588,92 +574,192 @@ async def test_fetch_target_building_root_level_fallback(mock_get_client):
     assert result.building_height == 16.43
 
 
-@pytest.mark.asyncio
-@patch("app.services.three_d_bag._get_client")
-async def test_fetch_bbox_respects_max_pages(mock_get_client):
-    """Bbox pagination stops at MAX_PAGES even if more pages are available."""
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
-    call_count = 0
-
-    def always_next_page(url, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        pand_id = f"036310000000{call_count:04d}"
-        page = _make_3dbag_response(
-            [_make_feature(pand_id)],
-            next_link=f"https://api.3dbag.nl/collections/pand/items?offset={call_count}",
-        )
-        return _make_mock_resp(page)
-
-    mock_client.get.side_effect = always_next_page
+async def test_fetch_bbox_respects_max_pages(bag_routes):
+    """Fallback pagination stops at MAX_PAGES even if more pages are available."""
+    bag_routes.bbox = _reject_batched(_paged(_endless_page))
 
     buildings = await _fetch_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
 
-    assert call_count == MAX_PAGES
+    # MAX_PAGES paginated requests + the rejected batched one
+    assert len(bag_routes.requests) == MAX_PAGES + 1
     assert len(buildings) == MAX_PAGES
 
 
-@pytest.mark.asyncio
 @patch("app.services.three_d_bag.time")
-@patch("app.services.three_d_bag._get_client")
-async def test_fetch_bbox_stops_on_time_budget(mock_get_client, mock_time):
+async def test_fetch_bbox_stops_on_time_budget(mock_time, bag_routes):
     """Bbox pagination stops when time budget is exhausted."""
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
     # Simulate: start=0.0, first remaining check=0.0, page_start=0.0,
     # page_end=2.0, then remaining check=19.5 (remaining=0.5 < 1.0 → break)
     mock_time.monotonic.side_effect = [0.0, 0.0, 0.0, 2.0, 19.5, 19.5]
-
-    call_count = 0
-
-    def always_next_page(url, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        pand_id = f"036310000000{call_count:04d}"
-        page = _make_3dbag_response(
-            [_make_feature(pand_id)],
-            next_link=f"https://api.3dbag.nl/collections/pand/items?offset={call_count}",
-        )
-        return _make_mock_resp(page)
-
-    mock_client.get.side_effect = always_next_page
+    bag_routes.bbox = _paged(_endless_page)
 
     buildings = await _fetch_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
 
-    assert call_count == 1
+    assert len(bag_routes.requests) == 1
     assert len(buildings) == 1
 
 
-@pytest.mark.asyncio
 @patch("app.services.three_d_bag.time")
-@patch("app.services.three_d_bag._get_client")
-async def test_fetch_bbox_returns_partial_on_mid_page_failure(mock_get_client, mock_time):
-    """Page 1 succeeds, page 2 fails with timeout — returns partial results."""
-    mock_client = AsyncMock()
-    mock_get_client.return_value = mock_client
-
+async def test_fetch_bbox_returns_partial_on_mid_page_failure(mock_time, bag_routes):
+    """Page 1 succeeds, the batched request for the rest times out — returns page 1."""
     # No time pressure — always return 0.0
     mock_time.monotonic.return_value = 0.0
 
-    call_count = 0
-
-    def page_then_fail(url, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            page = _make_3dbag_response(
+    def page_then_fail(request):
+        if len(bag_routes.requests) == 1:
+            return _json_response(_make_3dbag_response(
                 [_make_feature("0363100000000001")],
                 next_link="https://api.3dbag.nl/collections/pand/items?offset=1",
-            )
-            return _make_mock_resp(page)
-        raise httpx.TimeoutException("read timeout")
+            ))
+        raise httpx.ReadTimeout("read timeout", request=request)
 
-    mock_client.get.side_effect = page_then_fail
+    bag_routes.bbox = page_then_fail
 
     buildings = await _fetch_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
 
     assert len(buildings) == 1
     assert buildings[0].pand_id == "0363100000000001"
+    # The request that timed out was the batched one
+    assert bag_routes.requests[1].url.params["limit"] == _BATCHED_LIMIT
+
+
+# --- bbox cache tests ---
+
+
+async def test_cached_bbox_buildings_hit_skips_http(bag_routes):
+    bag_routes.bbox = _make_3dbag_response([_make_feature()])
+
+    first = await _cached_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
+    second = await _cached_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
+
+    assert len(bag_routes.requests) == 1
+    assert second == first
+
+
+async def test_cached_bbox_buildings_nearby_center_shifts_footprint(bag_routes):
+    """A hit from a point in the same 10 m cell is re-centered, not refetched."""
+    bag_routes.bbox = _make_3dbag_response([_make_feature()])
+
+    await _cached_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
+    shifted = await _cached_bbox_buildings(CENTER_X - 2.0, CENTER_Y - 1.0, 250.0)
+
+    assert len(bag_routes.requests) == 1
+    assert shifted[0].footprint[0] == (-3.0, -4.0)
+
+
+async def test_cached_bbox_buildings_concurrent_misses_share_one_fetch(bag_routes):
+    bag_routes.bbox = _make_3dbag_response([_make_feature()])
+
+    first, second = await asyncio.gather(
+        _cached_bbox_buildings(CENTER_X, CENTER_Y, 250.0),
+        _cached_bbox_buildings(CENTER_X, CENTER_Y, 250.0),
+    )
+
+    assert len(bag_routes.requests) == 1
+    assert first == second
+    assert three_d_bag_module._bbox_inflight == {}
+
+
+async def test_cached_bbox_buildings_refilters_radius_around_caller(bag_routes):
+    """Entries are fetched padded and trimmed to the radius around each caller."""
+    edge = _make_feature("0363100099999999")
+    # Square centered 18 m east of CENTER, i.e. 22 m east of CENTER_X - 4
+    edge["vertices"] = [[x + 18000, y, z] for x, y, z in _SQUARE_VERTICES]
+    bag_routes.bbox = _make_3dbag_response([edge])
+
+    # Both centers round into the same 10 m cell
+    far = await _cached_bbox_buildings(CENTER_X - 4.0, CENTER_Y, 20.0)
+    near = await _cached_bbox_buildings(CENTER_X, CENTER_Y, 20.0)
+
+    assert far == []
+    assert [b.pand_id for b in near] == ["0363100099999999"]
+    assert len(bag_routes.requests) == 1
+
+
+async def test_cached_bbox_buildings_refreshed_key_is_most_recent(bag_routes, monkeypatch):
+    """Reloading an expired entry moves it to the LRU end, so it isn't evicted next."""
+    monkeypatch.setattr(three_d_bag_module, "_BBOX_CACHE_MAX_ENTRIES", 2)
+    bag_routes.bbox = _make_3dbag_response([_make_feature()])
+    a, b, c = (CENTER_X, CENTER_X + 100.0, CENTER_X + 200.0)
+
+    await _cached_bbox_buildings(a, CENTER_Y, 250.0)
+    await _cached_bbox_buildings(b, CENTER_Y, 250.0)
+    key_a = next(iter(three_d_bag_module._bbox_cache))
+    _, *rest = three_d_bag_module._bbox_cache[key_a]
+    three_d_bag_module._bbox_cache[key_a] = (0.0, *rest)  # expired
+    await _cached_bbox_buildings(a, CENTER_Y, 250.0)
+    await _cached_bbox_buildings(c, CENTER_Y, 250.0)
+
+    # B was least recently used; the refreshed A survives alongside C
+    assert [k[0] for k in three_d_bag_module._bbox_cache] == [121000, 121200]
+
+
+async def test_cached_bbox_buildings_does_not_cache_empty(bag_routes):
+    bag_routes.bbox = _make_3dbag_response([])
+
+    await _cached_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
+    await _cached_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
+
+    assert len(bag_routes.requests) == 2
+
+
+async def test_cached_bbox_buildings_writes_through_to_redis(bag_routes, bbox_cache):
+    bag_routes.bbox = _make_3dbag_response([_make_feature()])
+
+    buildings = await _cached_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
+
+    key, value = bbox_cache.set.call_args.args
+    assert key == "3dbag_bbox:121000:487000:250"
+    assert value["center_x"] == CENTER_X
+    assert value["buildings"] == [b.model_dump() for b in buildings]
+    assert time.time() - value["fetched_at"] < 5
+
+
+def _redis_tile(fetched_at):
+    block = BuildingBlock(
+        pand_id="0363100012253924",
+        ground_height=1.75,
+        building_height=16.43,
+        footprint=[(-5.0, -5.0), (5.0, -5.0), (5.0, 5.0)],
+        year=1917,
+    )
+    # Round-trip through JSON as Redis would, so footprints arrive as lists
+    return orjson.loads(orjson.dumps({
+        "fetched_at": fetched_at,
+        "center_x": CENTER_X,
+        "center_y": CENTER_Y,
+        "buildings": [block.model_dump()],
+    }))
+
+
+async def test_cached_bbox_buildings_redis_hit_skips_http(bag_routes, bbox_cache):
+    bbox_cache.get.return_value = _redis_tile(time.time())
+
+    buildings = await _cached_bbox_buildings(CENTER_X - 2.0, CENTER_Y, 250.0)
+
+    assert bag_routes.requests == []
+    assert buildings[0].footprint[0] == (-3.0, -5.0)
+    bbox_cache.set.assert_not_called()
+
+
+async def test_cached_bbox_buildings_redis_hit_keeps_remaining_ttl(bag_routes, bbox_cache):
+    """A tile near its Redis expiry is not held in memory for a fresh hour."""
+    ttl = three_d_bag_module.settings.cache_ttl_3dbag_bbox
+    bbox_cache.get.return_value = _redis_tile(time.time() - (ttl - 60))
+
+    await _cached_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
+
+    expires_at = three_d_bag_module._bbox_cache[(121000, 487000, 250)][0]
+    assert expires_at - time.monotonic() <= 60
+
+
+async def test_fetch_bbox_drops_buildings_outside_radius(bag_routes):
+    """Buildings in the bbox corners (centroid beyond radius) are filtered out."""
+    corner = _make_feature("0363100099999999")
+    # Shift the square 200 m east and north: centroid ~(200, 200) m from center
+    corner["vertices"] = [[x + 200000, y + 200000, z] for x, y, z in _SQUARE_VERTICES]
+    bag_routes.bbox = _make_3dbag_response([_make_feature(), corner])
+
+    buildings = await _fetch_bbox_buildings(CENTER_X, CENTER_Y, 250.0)
+
+    assert [b.pand_id for b in buildings] == ["0363100012253924"]